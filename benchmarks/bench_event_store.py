@@ -0,0 +1,307 @@
+"""Benchmarks for the Baby Tracker EventStore and coordinator hot paths.
+
+Builds synthetic histories and times the store against stubbed Home Assistant
+pieces (an in-memory Store, a minimal hass and DataUpdateCoordinator), so no live
+HA installation is needed:
+
+    python benchmarks/bench_event_store.py --months 1 12 60
+
+Each scenario reports latency percentiles in milliseconds and the peak traced
+memory of loading the history.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+COMPONENT = ROOT / "custom_components" / "baby_tracker"
+
+
+# ------------------------------------------------------------------------------
+# HOME ASSISTANT STUBS
+# ------------------------------------------------------------------------------
+class StubStore:
+    """In-memory stand-in for homeassistant.helpers.storage.Store.
+
+    Data goes through a JSON round trip, like the real file, and migrations run
+    when the saved minor version is older than the requested one.
+    """
+
+    files: dict[str, str] = {}
+
+    def __init__(self, hass, version, key, minor_version=1, **kwargs):
+        self.hass = hass
+        self.version = version
+        self.minor_version = minor_version
+        self.key = key
+
+    async def async_load(self):
+        raw = self.files.get(self.key)
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        if data["minor_version"] != self.minor_version or data["version"] != self.version:
+            migrated = await self._async_migrate_func(data["version"], data["minor_version"], data["data"])
+            await self.async_save(migrated)
+            return migrated
+        return data["data"]
+
+    async def async_save(self, data):
+        self.files[self.key] = json.dumps({
+            "version": self.version,
+            "minor_version": self.minor_version,
+            "key": self.key,
+            "data": data,
+        })
+
+    async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
+        raise NotImplementedError
+
+
+class StubConfig:
+    def __init__(self, config_dir):
+        self.config_dir = config_dir
+
+    def path(self, *parts):
+        return str(Path(self.config_dir, *parts))
+
+
+class StubBus:
+    def async_listen_once(self, event_type, listener):
+        return lambda: None
+
+
+class StubHass:
+    """Just enough of HomeAssistant for the store and coordinator."""
+
+    def __init__(self, config_dir):
+        self.config = StubConfig(config_dir)
+        self.bus = StubBus()
+        self.data = {}
+        self.loop = asyncio.get_running_loop()
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+    def async_add_executor_job(self, target, *args):
+        return self.loop.run_in_executor(self._executor, target, *args)
+
+    def async_create_background_task(self, target, name, *args, **kwargs):
+        return self.loop.create_task(target, name=name)
+
+
+class StubCoordinator:
+    """Minimal DataUpdateCoordinator: refresh runs _async_update_data."""
+
+    def __init__(self, hass, logger, *, name, update_interval=None, **kwargs):
+        self.hass = hass
+        self.name = name
+        self.data = None
+
+    async def async_refresh(self):
+        self.data = await self._async_update_data()
+
+    def async_set_updated_data(self, data):
+        self.data = data
+
+
+def stub_call_later(hass, delay, action):
+    """Stand-in for homeassistant.helpers.event.async_call_later."""
+    handle = hass.loop.call_later(delay, lambda: hass.loop.create_task(action(datetime.now())))
+    return handle.cancel
+
+
+def install_stubs():
+    """Register stub modules and load the component without its __init__."""
+    def module(name, **attrs):
+        mod = types.ModuleType(name)
+        mod.__dict__.update(attrs)
+        sys.modules[name] = mod
+        return mod
+
+    module("homeassistant")
+    module("homeassistant.const", EVENT_HOMEASSISTANT_FINAL_WRITE="homeassistant_final_write")
+    module("homeassistant.core", HomeAssistant=StubHass, Event=object, callback=lambda func: func)
+    module("homeassistant.helpers")
+    module("homeassistant.helpers.event", async_call_later=stub_call_later)
+    module("homeassistant.helpers.storage", Store=StubStore, STORAGE_DIR=".storage")
+    module("homeassistant.helpers.update_coordinator", DataUpdateCoordinator=StubCoordinator)
+    dt_util = module("homeassistant.util.dt", as_local=lambda value: value.astimezone())
+    module("homeassistant.util", dt=dt_util)
+    module("custom_components", __path__=[str(ROOT / "custom_components")])
+    module("custom_components.baby_tracker", __path__=[str(COMPONENT)])
+
+
+# ------------------------------------------------------------------------------
+# SYNTHETIC HISTORY
+# ------------------------------------------------------------------------------
+SUMMARIES = {
+    "feeding": "🍼 Poppata",
+    "poo": "💩 Cacca",
+    "pee": "💧 Pipì",
+    "diaper": "💩+💧 Misto",
+    "growth": "📏 Crescita",
+}
+
+
+def build_history(days: int, legacy_fraction: float, seed: int = 42) -> list[dict]:
+    """Build stored records for `days` of history ending now.
+
+    Roughly 8 feedings, 6 pees, 3 poos and 1 mixed change a day plus a weekly growth
+    measurement. A fraction of the diaper/feeding records are legacy summary-only
+    ones, with no type-derived categories.
+    """
+    rng = random.Random(seed)
+    now = datetime.now()
+    records = []
+    for day in range(days, 0, -1):
+        base = now - timedelta(days=day)
+        mix = ["feeding"] * 8 + ["pee"] * 6 + ["poo"] * 3 + ["diaper"]
+        if day % 7 == 0:
+            mix.append("growth")
+        for event_type in mix:
+            start = base + timedelta(minutes=rng.randint(0, 24 * 60 - 1))
+            end = None
+            description = ""
+            if event_type == "feeding":
+                duration = rng.randint(5, 40)
+                end = start + timedelta(minutes=duration)
+                description = f"Lato: {rng.choice(['sx', 'dx', 'both', 'bottle'])}, Durata: {duration} min"
+            if event_type != "growth" and rng.random() < legacy_fraction:
+                event_type = "event"
+            records.append({
+                "type": event_type,
+                "start": start.isoformat(),
+                "end": end.isoformat() if end else None,
+                "summary": SUMMARIES.get(event_type, rng.choice(list(SUMMARIES.values()))),
+                "description": description,
+                "data": {},
+            })
+    records.sort(key=lambda record: record["start"])
+    return records
+
+
+# ------------------------------------------------------------------------------
+# MEASUREMENT
+# ------------------------------------------------------------------------------
+def percentiles(samples: list[float]) -> str:
+    """Format p50/p95/p99/max of samples given in seconds."""
+    ms = sorted(sample * 1000 for sample in samples)
+    if len(ms) == 1:
+        return f"{ms[0]:9.3f} ms (single run)"
+    cuts = statistics.quantiles(ms, n=100, method="inclusive")
+    return f"p50 {cuts[49]:8.3f}  p95 {cuts[94]:8.3f}  p99 {cuts[98]:8.3f}  max {ms[-1]:8.3f} ms"
+
+
+def timed(func, runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def atimed(func, runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def run_scenario(months: int, legacy_fraction: float, runs: int):
+    """Benchmark one history size and print its report."""
+    from custom_components.baby_tracker import event_store
+    from custom_components.baby_tracker.coordinator import BabyTrackerCoordinator
+    from custom_components.baby_tracker.models import BabyEvent
+
+    days = months * 30
+    records = build_history(days, legacy_fraction)
+    StubStore.files = {
+        f"{event_store.STORAGE_KEY}_bench": json.dumps({
+            "version": event_store.STORAGE_VERSION,
+            "minor_version": 1,  # Pre-category snapshot, so the first load migrates
+            "key": "bench",
+            "data": {"events": records},
+        })
+    }
+    print(f"\n=== {months} month(s): {len(records)} events, {legacy_fraction:.0%} legacy ===")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = StubHass(config_dir)
+        store = event_store.EventStore(hass, "bench")
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        await store.async_load()
+        recent = time.perf_counter() - started
+        await store.async_ensure_history()
+        total = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{'async_load (first, migrates)':32} recent {recent * 1000:8.1f} ms  total {total * 1000:8.1f} ms  peak {peak / 1e6:6.1f} MB")
+
+        async def reload():
+            fresh = event_store.EventStore(hass, "bench")
+            await fresh.async_load()
+            await fresh.async_ensure_history()
+
+        print(f"{'async_load (incl. history)':32} {percentiles(await atimed(reload, max(3, runs // 20)))}")
+
+        now = datetime.now()
+
+        async def add():
+            await store.add_event(BabyEvent(type="pee", start=datetime.now(), summary=SUMMARIES["pee"]))
+
+        print(f"{'add_event':32} {percentiles(await atimed(add, runs))}")
+
+        async def burst():
+            for _ in range(20):
+                await add()
+            await store.async_flush()
+
+        print(f"{'20 x add_event + async_flush':32} {percentiles(await atimed(burst, max(3, runs // 20)))}")
+        print(f"{'async_save (compaction)':32} {percentiles(await atimed(store.async_save, max(3, runs // 20)))}")
+
+        rng = random.Random(7)
+        for label, span in (("week", timedelta(days=7)), ("month", timedelta(days=30))):
+            def window(span=span):
+                start = now - timedelta(days=rng.uniform(0, max(days - span.days, 1)))
+                store.get_events(start, start + span)
+            print(f"{'get_events ' + label:32} {percentiles(timed(window, runs))}")
+
+        print(f"{'get_stats_last_24h':32} {percentiles(timed(store.get_stats_last_24h, runs))}")
+        print(f"{'get_last_events':32} {percentiles(timed(store.get_last_events, runs))}")
+
+        coordinator = BabyTrackerCoordinator(hass, store)
+        print(f"{'coordinator refresh':32} {percentiles(await atimed(coordinator.async_refresh, runs))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--months", type=int, nargs="+", default=[1, 6, 12, 24, 60],
+                        help="history sizes to benchmark, in months")
+    parser.add_argument("--legacy", type=float, default=0.1,
+                        help="fraction of summary-only legacy records")
+    parser.add_argument("--runs", type=int, default=200, help="samples per measurement")
+    args = parser.parse_args()
+
+    install_stubs()
+    for months in args.months:
+        asyncio.run(run_scenario(months, args.legacy, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,39 @@
 """The Baby Tracker integration."""
 import logging
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, CONF_TELEGRAM_TOKEN, CONF_ALLOWED_CHAT_IDS, CONF_BABY_NAME
-from .bot import setup_bot
+from .const import (
+    DOMAIN,
+    CONF_TELEGRAM_TOKEN,
+    CONF_ALLOWED_CHAT_IDS,
+    CONF_BABY_NAME,
+    CONF_RETENTION_DAYS,
+    CONF_SAVE_DELAY,
+    CONF_WEBHOOK_URL,
+    CONF_BIRTH_DATE,
+    CONF_SEX,
+    DEFAULT_RETENTION_DAYS,
+    DEFAULT_SAVE_DELAY,
+    ATTR_ENTRY_ID,
+)
+from .bot import get_registry
 from .event_store import EventStore
 from .coordinator import BabyTrackerCoordinator
+from .dashboard import LiveDashboard
+from .webhook import BabyTrackerWebhookView
+from .history_io import SERVICE_SCHEMA, async_export, async_import
 
 _LOGGER = logging.getLogger(__name__)
 
 import os
+import voluptuous as vol
 from homeassistant.components.http import StaticPathConfig
+import homeassistant.helpers.config_validation as cv
+
+ENTRY_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): cv.string})
 
 async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the Baby Tracker component."""
@@ -23,6 +45,59 @@ async def async_setup(hass: HomeAssistant, config: dict):
             cache_headers=False
         )
     ])
+    # Telegram updates for entries in webhook mode
+    hass.http.register_view(BabyTrackerWebhookView())
+
+    # Services are registered once; entry_id picks the baby they act on, and may
+    # be left out while a single baby is configured
+    hass.data.setdefault(DOMAIN, {})
+
+    def get_coordinator(call: ServiceCall) -> BabyTrackerCoordinator:
+        # hass.data also holds the stores, bots and dashboards under derived keys
+        coordinators = {
+            entry_id: value for entry_id, value in hass.data[DOMAIN].items()
+            if isinstance(value, BabyTrackerCoordinator)
+        }
+        if (entry_id := call.data.get(ATTR_ENTRY_ID)) is None:
+            if len(coordinators) != 1:
+                raise ServiceValidationError(
+                    f"{len(coordinators)} Baby Tracker entries loaded: set entry_id to pick the baby"
+                )
+            return next(iter(coordinators.values()))
+        if (coordinator := coordinators.get(entry_id)) is None:
+            raise ServiceValidationError(f"Baby Tracker entry not loaded: {entry_id}")
+        return coordinator
+
+    async def handle_start_feeding(call: ServiceCall):
+        coordinator = get_coordinator(call)
+        user = await hass.auth.async_get_user(call.context.user_id) if call.context.user_id else None
+        coordinator.start_feeding(started_by=user.name if user else None)
+
+    async def handle_stop_feeding(call: ServiceCall):
+        # No side to ask for: the feeding is logged right away
+        coordinator = get_coordinator(call)
+        coordinator.stop_feeding()
+        await coordinator.async_log_stopped_feeding(None)
+
+    async def handle_export_events(call: ServiceCall):
+        store = get_coordinator(call).store
+        exported = await async_export(hass, store, call.data["path"], call.data.get("format"))
+        return {"exported": exported}
+
+    async def handle_import_events(call: ServiceCall):
+        coordinator = get_coordinator(call)
+        return await async_import(hass, coordinator, call.data["path"], call.data.get("format"))
+
+    hass.services.async_register(DOMAIN, "start_feeding", handle_start_feeding, schema=ENTRY_SCHEMA)
+    hass.services.async_register(DOMAIN, "stop_feeding", handle_stop_feeding, schema=ENTRY_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, "export_events", handle_export_events,
+        schema=SERVICE_SCHEMA, supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, "import_events", handle_import_events,
+        schema=SERVICE_SCHEMA, supports_response=SupportsResponse.OPTIONAL
+    )
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
@@ -34,6 +109,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     # Options + Data merge logic
     allowed_ids_str = entry.options.get(CONF_ALLOWED_CHAT_IDS, entry.data.get(CONF_ALLOWED_CHAT_IDS, ""))
     baby_name = entry.options.get(CONF_BABY_NAME, entry.data.get(CONF_BABY_NAME, "Baby"))
+    retention_days = entry.options.get(CONF_RETENTION_DAYS, DEFAULT_RETENTION_DAYS)
+    save_delay = entry.options.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY)
+    webhook_url = entry.options.get(CONF_WEBHOOK_URL, "")
+    # Growth percentiles need both
+    birth_date = dt_util.parse_date(entry.options.get(CONF_BIRTH_DATE) or "")
+    sex = entry.options.get(CONF_SEX) or None
     
     allowed_ids = []
     if allowed_ids_str:
@@ -47,14 +128,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         return False
 
     # 1. Initialize Store
-    store = EventStore(hass, entry.entry_id)
+    store = EventStore(hass, entry.entry_id, retention_days, save_delay)
     await store.async_load()
 
     # 2. Initialize Coordinator
-    coordinator = BabyTrackerCoordinator(hass, store)
+    coordinator = BabyTrackerCoordinator(hass, store, birth_date, sex)
+    # A feeding timer running before the restart/reload keeps going
+    await coordinator.async_restore_session()
     # Perform first refresh (lazy load check)
     await coordinator.async_config_entry_first_refresh()
 
+    # Older history is parsed in the background: refresh once it is merged in
+    async def _async_refresh_after_history():
+        await store.async_ensure_history()
+        await coordinator.async_refresh()
+
+    entry.async_create_background_task(hass, _async_refresh_after_history(), "baby_tracker_history")
+
     # Store references
     hass.data[DOMAIN][entry.entry_id] = coordinator
     # Keep store accessible efficiently if needed, or just access via coordinator
@@ -62,26 +152,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     _LOGGER.info("Starting %s Tracker Bot... (v2.0)", baby_name)
     
-    # 3. Start Bot
+    # 3. Start Bot (or join the one already running for this token: one
+    # application serves every baby sharing the bot)
     try:
-        application = await setup_bot(hass, token, allowed_ids, entry.entry_id, baby_name)
+        application = await get_registry(hass).async_acquire(
+            token, entry.entry_id, baby_name, allowed_ids, webhook_url
+        )
         hass.data[DOMAIN][entry.entry_id + "_bot"] = application
+
+        # Pinned live status messages, edited as the coordinator publishes
+        dashboard = LiveDashboard(hass, application.bot, coordinator, entry.entry_id, baby_name)
+        await dashboard.async_start()
+        hass.data[DOMAIN][entry.entry_id + "_dashboard"] = dashboard
         
         # Forward setup
         await hass.config_entries.async_forward_entry_setups(
             entry, 
             ["calendar", "sensor", "binary_sensor"]
         )
-        
-        # Register Services (v1.1.0)
-        async def handle_start_feeding(call):
-            coordinator.start_feeding()
-        
-        async def handle_stop_feeding(call):
-            coordinator.stop_feeding()
-            
-        hass.services.async_register(DOMAIN, "start_feeding", handle_start_feeding)
-        hass.services.async_register(DOMAIN, "stop_feeding", handle_stop_feeding)
+
 
         # Listen for updates to options
         entry.async_on_unload(entry.add_update_listener(update_listener))
@@ -94,18 +183,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
-    # Stop Bot
-    if bot_app := hass.data[DOMAIN].pop(entry.entry_id + "_bot", None):
-        _LOGGER.info("Stopping Baby Tracker Bot...")
-        await bot_app.updater.stop()
-        await bot_app.stop()
-        await bot_app.shutdown()
+    if dashboard := hass.data[DOMAIN].pop(entry.entry_id + "_dashboard", None):
+        await dashboard.async_stop()
+
+    # Stop Bot (only once no other baby uses it)
+    if hass.data[DOMAIN].pop(entry.entry_id + "_bot", None):
+        await get_registry(hass).async_release(entry.data[CONF_TELEGRAM_TOKEN], entry.entry_id)
     
+    # Flush events still waiting for the scheduled write
+    if store := hass.data[DOMAIN].get(entry.entry_id + "_store"):
+        await store.async_unload()
+
     # Remove data
-    hass.data[DOMAIN].pop(entry.entry_id, None)       # Coordinator
+    if coordinator := hass.data[DOMAIN].pop(entry.entry_id, None):
+        await coordinator.async_shutdown()
     hass.data[DOMAIN].pop(entry.entry_id + "_store", None) # Store
 
-    return await hass.config_entries.async_unload_platforms(entry, ["calendar"])
+    return await hass.config_entries.async_unload_platforms(entry, ["calendar", "sensor", "binary_sensor"])
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
     """Handle options update."""
@@ -38,4 +38,13 @@ class BabyFeedingSensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return true if feeding is active."""
-        return self.coordinator.is_feeding
+        return self.coordinator.data.is_feeding
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the live feeding session details."""
+        start = self.coordinator.data.feeding_start_time
+        return {
+            "start": start.isoformat() if start else None,
+            "started_by": self.coordinator.data.feeding_started_by,
+        }
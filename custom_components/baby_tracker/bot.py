@@ -1,9 +1,13 @@
 """Telegram Bot Logic for Baby Tracker."""
+import asyncio
 import logging
 from functools import wraps
 from datetime import datetime, timedelta
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.request import BaseRequest
+from telegram.helpers import escape_markdown
 from telegram.ext import (
+    Application,
     ApplicationBuilder,
     ContextTypes,
     CommandHandler,
@@ -14,28 +18,23 @@ from telegram.ext import (
 )
 from homeassistant.core import HomeAssistant
 from .const import DOMAIN
-from .models import BabyEvent
+from .dashboard import render_status
+from .models import GROWTH_METRICS, BabyEvent
+from .outbound import OutboundQueue
+from .webhook import async_start_webhook, async_stop_webhook
 
 _LOGGER = logging.getLogger(__name__)
 
-# Entity Constant Map
-ENTITIES = {
-    'poo_time': 'input_datetime.baby_last_poo',
-    'pee_time': 'input_datetime.baby_last_pee',
-    'poo_counter': 'counter.baby_diaper_poo_daily',
-    'pee_counter': 'counter.baby_diaper_pee_daily',
-    # Feeding
-    'feeding_start': 'input_datetime.baby_last_feeding_start',
-    'feeding_end': 'input_datetime.baby_last_feeding_end',
-    'feeding_active': 'input_boolean.baby_feeding_timer_active',
-    'feeding_side': 'input_text.baby_last_feeding_side',
-    'feeding_duration': 'input_text.baby_last_feeding_duration',
-    'feeding_counter': 'counter.baby_feeding_daily',
-    # Growth
-    'weight': 'input_number.baby_weight',
-    'height': 'input_number.baby_height',
-    'head': 'input_number.baby_head_circumference',
-    'growth_time': 'input_datetime.baby_last_growth'
+# HTTP connection pool shared by the handlers (replies go through OutboundQueue,
+# so a few connections are plenty); polling keeps its own single connection
+CONNECTION_POOL_SIZE = 8
+POOL_TIMEOUT = 10.0
+
+# Growth menu choice -> (metric, label)
+GROWTH_CHOICES = {
+    'growth_weight': ('weight', "⚖️ Peso"),
+    'growth_height': ('height', "📏 Altezza"),
+    'growth_head': ('head', "🧠 Circonferenza"),
 }
 
 # Conversation States
@@ -53,30 +52,54 @@ def get_hass(context: ContextTypes.DEFAULT_TYPE) -> HomeAssistant:
     """Retrieve hass instance from bot_data."""
     return context.bot_data.get('hass')
 
+def get_entry_id(context: ContextTypes.DEFAULT_TYPE) -> str | None:
+    """Return the config entry of the baby selected by the user (see check_access)."""
+    babies = context.bot_data.get('babies', {})
+    entry_id = context.user_data.get('entry_id') if context.user_data is not None else None
+    return entry_id if entry_id in babies else next(iter(babies), None)
+
+def get_baby_name(context: ContextTypes.DEFAULT_TYPE) -> str:
+    """Return the name of the selected baby."""
+    baby = context.bot_data.get('babies', {}).get(get_entry_id(context))
+    return baby['name'] if baby else 'Baby'
+
 def get_coordinator(context: ContextTypes.DEFAULT_TYPE):
-    """Retrieve Coordinator instance."""
+    """Retrieve Coordinator instance of the selected baby."""
     hass = get_hass(context)
-    entry_id = context.bot_data.get('entry_id')
-    return hass.data[DOMAIN].get(entry_id)
+    return hass.data[DOMAIN].get(get_entry_id(context))
 
-... (This replace is too big to do in one chunks reliably, I will use multi_replace for targeted fixes)
+def get_dashboard(context: ContextTypes.DEFAULT_TYPE):
+    """Retrieve LiveDashboard instance of the selected baby."""
+    hass = get_hass(context)
+    return hass.data[DOMAIN].get(f"{get_entry_id(context)}_dashboard")
 
 
 def check_access(func):
-    """Decorator to check if user has access."""
+    """Decorator to check if user has access, to at least one baby.
+
+    Also keeps the user's baby selection (user_data['entry_id']) among the babies
+    the user may access, listed in user_data['babies'].
+    """
     @wraps(func)
     async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
-        allowed_ids = context.bot_data.get('allowed_ids', [])
         user_id = update.effective_user.id
-        
-        if allowed_ids and user_id not in allowed_ids:
+        # An empty allowed list means everyone may access that baby
+        babies = [
+            entry_id for entry_id, baby in context.bot_data.get('babies', {}).items()
+            if not baby['allowed_ids'] or user_id in baby['allowed_ids']
+        ]
+
+        if not babies:
             _LOGGER.warning("Unauthorized access attempt from User ID: %s", user_id)
             if update.message:
                 await update.message.reply_text(f"⛔ **Access Denied**\nYour ID: `{user_id}`\n\nAsk the owner to add this ID to Home Assistant Baby Tracker configuration.", parse_mode='Markdown')
             elif update.callback_query:
                 await update.callback_query.answer("⛔ Access Denied", show_alert=True)
             return ConversationHandler.END
-            
+
+        context.user_data['babies'] = babies
+        if context.user_data.get('entry_id') not in babies:
+            context.user_data['entry_id'] = babies[0]
         return await func(update, context, *args, **kwargs)
     return wrapper
 
@@ -86,8 +109,17 @@ def check_access(func):
 def back_button():
     return InlineKeyboardMarkup([[InlineKeyboardButton("🔙 Menu Principale", callback_data='main_menu')]])
 
-def main_menu_keyboard():
-    return InlineKeyboardMarkup([
+def main_menu_keyboard(context: ContextTypes.DEFAULT_TYPE = None):
+    """Main menu, with a baby selector when the user follows several babies."""
+    selector = []
+    if context is not None and len(babies := context.user_data.get('babies', [])) > 1:
+        selected = get_entry_id(context)
+        names = context.bot_data['babies']
+        selector = [[
+            InlineKeyboardButton(("✅ " if entry_id == selected else "👶 ") + names[entry_id]['name'], callback_data=f'baby_{entry_id}')
+            for entry_id in babies
+        ]]
+    return InlineKeyboardMarkup(selector + [
         [InlineKeyboardButton("💩 E' Cacca", callback_data='diaper_poo'),
          InlineKeyboardButton("💧 E' Pipì", callback_data='diaper_pee')],
         [InlineKeyboardButton("💩 + 💧 Entrambi", callback_data='diaper_both')],
@@ -96,19 +128,8 @@ def main_menu_keyboard():
         [InlineKeyboardButton("📊 Stato", callback_data='status')]
     ])
 
-async def update_timestamp(hass: HomeAssistant, entity_id: str, dt: datetime = None):
-    """Update an input_datetime to now or specific time."""
-    if dt is None:
-        dt = datetime.now()
-    
-    await hass.services.async_call(
-        'input_datetime', 
-        'set_datetime', 
-        {'entity_id': entity_id, 'timestamp': dt.timestamp()}
-    )
-
-async def log_event(context: ContextTypes.DEFAULT_TYPE, event_type: str, summary: str, start_dt: datetime, end_dt: datetime = None, description: str = ""):
-    """Log an event to the Coordinator."""
+async def log_event(context: ContextTypes.DEFAULT_TYPE, event_type: str, summary: str, start_dt: datetime, end_dt: datetime = None, description: str = "", **fields):
+    """Log an event to the Coordinator (fields: typed fields like side or metric)."""
     coord = get_coordinator(context)
     if coord:
         event = BabyEvent(
@@ -116,7 +137,8 @@ async def log_event(context: ContextTypes.DEFAULT_TYPE, event_type: str, summary
             start=start_dt,
             end=end_dt,
             summary=summary,
-            description=description
+            description=description,
+            **fields
         )
         await coord.async_add_event(event)
 
@@ -127,22 +149,29 @@ async def log_event(context: ContextTypes.DEFAULT_TYPE, event_type: str, summary
 @check_access
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Sends the main menu."""
-    baby_name = context.bot_data.get('baby_name', 'Baby')
-    msg = f'👶 **{baby_name} Tracker** - Main Menu:'
+    baby_name = get_baby_name(context)
+    msg = f'👶 **{escape_markdown(baby_name)} Tracker** - Main Menu:'
     
     if update.message:
-        await update.message.reply_text(msg, reply_markup=main_menu_keyboard(), parse_mode='Markdown')
+        await update.message.reply_text(msg, reply_markup=main_menu_keyboard(context), parse_mode='Markdown')
     else:
         query = update.callback_query
         await query.answer()
-        await query.edit_message_text(msg, reply_markup=main_menu_keyboard(), parse_mode='Markdown')
+        await query.edit_message_text(msg, reply_markup=main_menu_keyboard(context), parse_mode='Markdown')
     return ConversationHandler.END
 
+@check_access
+async def select_baby(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Switch the baby the user is logging for."""
+    entry_id = update.callback_query.data.replace('baby_', '', 1)
+    if entry_id in context.user_data['babies']:
+        context.user_data['entry_id'] = entry_id
+    return await start(update, context)
+
 @check_access
 async def main_menu_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     data = query.data
-    hass = get_hass(context)
 
     if data == 'main_menu':
         await start(update, context)
@@ -157,8 +186,7 @@ async def main_menu_callback(update: Update, context: ContextTypes.DEFAULT_TYPE)
         is_active = coord.is_feeding if coord else False
         
         if is_active:
-            keyboard = [[InlineKeyboardButton("⏹️ STOP Poppata", callback_data='live_stop')]]
-            await query.edit_message_text("⏱️ Poppata in corso... Terminare?", reply_markup=InlineKeyboardMarkup(keyboard))
+            await query.edit_message_text("⏱️ Poppata in corso... Terminare?", reply_markup=live_keyboard())
             return LIVE_STOP_SIDE 
         else:
             keyboard = [
@@ -186,7 +214,6 @@ async def main_menu_callback(update: Update, context: ContextTypes.DEFAULT_TYPE)
 async def handle_diaper(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     data = query.data
-    hass = get_hass(context)
     await query.answer()
 
     now = datetime.now()
@@ -210,45 +237,9 @@ async def show_status(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     await query.answer()
     
-    store = get_store(context)
-    stats = {"poo": 0, "pee": 0, "feeding": 0}
-    last_events = {"feeding": None, "poo": None, "pee": None}
-
-    if store:
-        stats = store.get_stats_last_24h()
-        last_events = store.get_last_events()
-    
-    # Helper to format frequency
-    def fmt_time(dt_iso):
-        if not dt_iso: return "--:--"
-        dt = datetime.fromisoformat(dt_iso)
-        return dt.strftime("%H:%M")
-    
-    def fmt_ago(event):
-        if not event: return "Mai"
-        dt = datetime.fromisoformat(event['end']) # Use end time for age
-        diff = datetime.now() - dt
-        mins = int(diff.total_seconds() / 60)
-        
-        if mins < 60:
-            return f"{mins} min fa"
-        hours = mins // 60
-        mins = mins % 60
-        return f"{hours}h {mins}m fa"
-
-    
-    text = (
-        f"📊 **Statistiche Ultime 24h**\n\n"
-        f"🍼 **Poppate**: {stats['feeding']}\n"
-        f"   🕒 Ultima: {fmt_ago(last_events['feeding'])}\n"
-        f"   📝 {last_events['feeding']['description'] if last_events['feeding'] else ''}\n\n"
-        
-        f"💩 **Cacche**: {stats['poo']}\n"
-        f"   🕒 Ultima: {fmt_ago(last_events['poo'])}\n"
-        
-        f"💧 **Pipì**: {stats['pee']}\n"
-        f"   🕒 Ultima: {fmt_ago(last_events['pee'])}\n"
-    )
+    # Rendered from the coordinator's cached snapshot, no store scan
+    coord = get_coordinator(context)
+    text = render_status(coord.data, baby_name=get_baby_name(context)) if coord and coord.data else "📊 Nessun dato disponibile."
     await query.edit_message_text(text, parse_mode='Markdown', reply_markup=back_button())
 
 # ------------------------------------------------------------------------------
@@ -258,15 +249,13 @@ async def show_status(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def feeding_menu_choice(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     data = query.data
-    hass = get_hass(context)
     await query.answer()
 
     if data == 'live_start':
         coord = get_coordinator(context)
-        if coord: coord.start_feeding()
-        
-        keyboard = [[InlineKeyboardButton("⏹️ STOP Poppata", callback_data='live_stop')]]
-        await query.edit_message_text("▶️ Poppata AVVIATA! Premi Stop quando finito.", reply_markup=InlineKeyboardMarkup(keyboard))
+        if coord: coord.start_feeding(started_by=update.effective_user.first_name)
+
+        await query.edit_message_text("▶️ Poppata AVVIATA! Premi Stop quando finito.", reply_markup=live_keyboard())
         return LIVE_STOP_SIDE 
 
     elif data == 'manual_entry':
@@ -284,17 +273,37 @@ async def feeding_menu_choice(update: Update, context: ContextTypes.DEFAULT_TYPE
         await start(update, context)
         return ConversationHandler.END
 
+def live_keyboard():
+    """Keyboard shown while the live feeding timer runs."""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton("🔄 Ora SX", callback_data='live_switch_sx'),
+         InlineKeyboardButton("🔄 Ora DX", callback_data='live_switch_dx')],
+        [InlineKeyboardButton("⏹️ STOP Poppata", callback_data='live_stop')]
+    ])
+
 @check_access
 async def live_stop_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     data = query.data
-    hass = get_hass(context)
     await query.answer()
 
-    if data == 'live_stop':
+    # Buttons of a message sent before a restart (or pressed by the other parent)
+    # can outlive the feeding they control
+    if data.startswith('live_') and not (get_coordinator(context) and get_coordinator(context).is_feeding):
+        await query.edit_message_text("⏹️ Nessuna poppata in corso.", reply_markup=back_button())
+        return ConversationHandler.END
+
+    if data.startswith('live_switch_'):
+        side = data.replace('live_switch_', '')
         coord = get_coordinator(context)
-        if coord: coord.stop_feeding()
-        
+        if coord: coord.switch_side(side)
+        await query.edit_message_text(f"⏱️ Poppata in corso, lato {side.upper()}.", reply_markup=live_keyboard())
+        return LIVE_STOP_SIDE
+
+    if data == 'live_stop':
+        # The stopped session stays persisted until a side is chosen
+        get_coordinator(context).stop_feeding()
+
         keyboard = [
             [InlineKeyboardButton("Sinistra (SX)", callback_data='side_sx'),
              InlineKeyboardButton("Destra (DX)", callback_data='side_dx')],
@@ -306,19 +315,15 @@ async def live_stop_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     if data.startswith('side_'):
         side = data.replace('side_', '')
-        # We don't need input_text anymore, we just log the event with data
-        
+        # Ends at STOP, whenever the side is picked (even after a restart)
         coord = get_coordinator(context)
-        # Calculate duration
-        start_dt = coord.feeding_start_time if coord and coord.feeding_start_time else datetime.now()
-        end_dt = datetime.now()
-        
-        duration = int((end_dt - start_dt).total_seconds() / 60)
-        desc = f"Lato: {side}, Durata: {duration} min"
-
-        await log_event(context, "feeding", "🍼 Poppata", start_dt, end_dt, desc)
-        
-        await query.edit_message_text(f"✅ Poppata registrata! ({duration} min)", reply_markup=back_button())
+        event = await coord.async_log_stopped_feeding(side) if coord else None
+        if event is None:
+            await query.edit_message_text("⏹️ Nessuna poppata da registrare.", reply_markup=back_button())
+        else:
+            await query.edit_message_text(
+                f"✅ Poppata registrata! ({event.duration_s // 60} min)", reply_markup=back_button()
+            )
         return ConversationHandler.END
 
 @check_access
@@ -385,21 +390,126 @@ async def manual_duration_choice(update: Update, context: ContextTypes.DEFAULT_T
 async def manual_side_choice(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     data = query.data
-    hass = get_hass(context)
     await query.answer()
 
     side = data.replace('side_', '')
     start_dt = context.user_data['manual_start']
     end_dt = context.user_data['manual_end']
-    duration_str = f"{context.user_data['manual_duration']} min"
-    
-    desc = f"Lato: {side}, Durata: {duration_str}"
+    duration_min = context.user_data['manual_duration']
+
+    desc = f"Lato: {side}, Durata: {duration_min} min"
 
-    await log_event(context, "feeding", "🍼 Poppata", start_dt, end_dt, desc)
+    await log_event(context, "feeding", "🍼 Poppata", start_dt, end_dt, desc, side=side, duration_s=duration_min * 60)
 
     await query.edit_message_text("✅ Poppata manuale registrata con successo!", reply_markup=back_button())
     return ConversationHandler.END
 
+# ------------------------------------------------------------------------------
+# BATCH LOGGING
+# ------------------------------------------------------------------------------
+LOG_USAGE = (
+    "📝 Uso: `/log 02:10 poppata sx 15; 03:40 pipi; 05:00 cacca; 06:30 poppata biberon 120ml`\n"
+    "Tipi: poppata, pipi, cacca, misto. Lati: sx, dx, entrambi, biberon. Durata in minuti, quantità in ml."
+)
+
+LOG_KINDS = {
+    'poppata': 'feeding', 'pop': 'feeding', 'allattamento': 'feeding', 'feed': 'feeding',
+    'pipi': 'pee', 'pipì': 'pee', 'pee': 'pee',
+    'cacca': 'poo', 'poo': 'poo',
+    'misto': 'diaper', 'cambio': 'diaper', 'both': 'diaper',
+}
+LOG_SIDES = {'sx': 'sx', 'dx': 'dx', 'entrambi': 'both', 'both': 'both', 'biberon': 'bottle', 'bottle': 'bottle'}
+LOG_SUMMARIES = {'feeding': "🍼 Poppata", 'pee': "💧 Pipì", 'poo': "💩 Cacca", 'diaper': "💩+💧 Misto"}
+
+def parse_log_batch(text: str, now: datetime):
+    """Parse `HH:MM kind [side] [minutes] [NNml]` entries separated by ';' or newlines.
+
+    Times later than now are taken as yesterday. Returns (events, errors).
+    """
+    events, errors = [], []
+    for entry in filter(None, (part.strip() for part in text.replace('\n', ';').split(';'))):
+        tokens = entry.lower().split()
+        try:
+            hours, minutes = tokens[0].replace('.', ':').split(':')
+            start_dt = now.replace(hour=int(hours), minute=int(minutes), second=0, microsecond=0)
+        except ValueError:
+            errors.append(f"⏰ Orario non valido: `{entry}`")
+            continue
+        if start_dt > now:
+            start_dt -= timedelta(days=1)
+
+        event_type = LOG_KINDS.get(tokens[1]) if len(tokens) > 1 else None
+        if not event_type:
+            errors.append(f"❓ Tipo mancante o sconosciuto: `{entry}`")
+            continue
+
+        side, duration, volume = None, None, None
+        for token in tokens[2:]:
+            if token in LOG_SIDES and event_type == 'feeding':
+                side = LOG_SIDES[token]
+            elif token.isdigit() and event_type == 'feeding':
+                duration = int(token)
+            elif token.endswith('ml') and token[:-2].isdigit() and event_type == 'feeding':
+                volume = int(token[:-2])
+            else:
+                errors.append(f"❓ Non capisco `{token}` in `{entry}`")
+                break
+        else:
+            end_dt = None
+            description = ""
+            if event_type == 'feeding':
+                end_dt = start_dt + timedelta(minutes=duration or 0)
+                description = f"Lato: {side or '?'}, Durata: {duration or 0} min"
+                if volume:
+                    description += f", {volume} ml"
+            events.append(BabyEvent(
+                type=event_type,
+                start=start_dt,
+                end=end_dt,
+                summary=LOG_SUMMARIES[event_type],
+                description=description,
+                side=side,
+                duration_s=duration * 60 if duration is not None else None,
+                volume_ml=volume
+            ))
+    return events, errors
+
+@check_access
+async def log_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Back-fill many events from one message, committed as a single batch."""
+    parts = update.message.text.split(maxsplit=1)
+    if len(parts) < 2:
+        await update.message.reply_text(LOG_USAGE, parse_mode='Markdown')
+        return
+
+    events, errors = parse_log_batch(parts[1], datetime.now())
+    if errors:
+        # Nothing is saved on errors, so the whole message can simply be resent
+        await update.message.reply_text("⛔ Nessun evento salvato:\n" + "\n".join(errors) + "\n\n" + LOG_USAGE, parse_mode='Markdown')
+        return
+
+    coord = get_coordinator(context)
+    if coord:
+        await coord.async_add_events(events)
+
+    lines = [f"• {ev.start:%d/%m %H:%M} {ev.summary}" + (f" ({ev.description})" if ev.description else "") for ev in sorted(events, key=lambda ev: ev.start)]
+    await update.message.reply_text(f"✅ Registrati {len(events)} eventi:\n" + "\n".join(lines), reply_markup=main_menu_keyboard(context))
+
+@check_access
+async def dashboard_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Pin a live status message in this chat (`/dashboard off` to stop)."""
+    dashboard = get_dashboard(context)
+    if not dashboard:
+        return
+    chat_id = update.effective_chat.id
+    if context.args and context.args[0].lower() in ('off', 'stop'):
+        if await dashboard.async_unpin(chat_id):
+            await update.message.reply_text("📌 Dashboard live disattivata.")
+        else:
+            await update.message.reply_text("📌 Nessuna dashboard live in questa chat.")
+        return
+    await dashboard.async_pin(chat_id)
+
 # ------------------------------------------------------------------------------
 # GROWTH FLOW
 # ------------------------------------------------------------------------------
@@ -433,7 +543,6 @@ async def growth_menu_choice(update: Update, context: ContextTypes.DEFAULT_TYPE)
 async def growth_input_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     text = update.message.text.replace(',', '.')
     growth_type = context.user_data.get('growth_type')
-    hass = get_hass(context)
 
     try:
         value = float(text)
@@ -441,38 +550,47 @@ async def growth_input_handler(update: Update, context: ContextTypes.DEFAULT_TYP
         await update.message.reply_text("⛔ Per favore inserisci un numero valido (es. 3.5). Riprova:")
         return GROWTH_INPUT
 
-    entity_map = {
-        'growth_weight': ENTITIES['weight'],
-        'growth_height': ENTITIES['height'],
-        'growth_head': ENTITIES['head']
-    }
-    
-    if growth_type in entity_map:
-        await hass.services.async_call('input_number', 'set_value', {'entity_id': entity_map[growth_type], 'value': value})
-        await update_timestamp(hass, ENTITIES['growth_time'])
-        
-        await update.message.reply_text(f"✅ Valore registrato: {value}", reply_markup=main_menu_keyboard())
+    if growth_type in GROWTH_CHOICES:
+        metric, label = GROWTH_CHOICES[growth_type]
+        await log_event(
+            context, "growth", label, datetime.now(),
+            description=f"{value} {GROWTH_METRICS[metric]}", metric=metric, value=value
+        )
+
+        await update.message.reply_text(f"✅ Valore registrato: {value}", reply_markup=main_menu_keyboard(context))
     else:
-        await update.message.reply_text("❌ Errore interno.", reply_markup=main_menu_keyboard())
+        await update.message.reply_text("❌ Errore interno.", reply_markup=main_menu_keyboard(context))
 
     return ConversationHandler.END
 
 
-async def setup_bot(hass: HomeAssistant, token: str, allowed_ids: list, entry_id: str, baby_name: str):
-    """Initialize and start the bot."""
-    application = ApplicationBuilder().token(token).build()
+def build_application(hass: HomeAssistant, token: str, request: BaseRequest = None):
+    """Create the bot application with all handlers registered (babies: see add_baby)."""
+    builder = ApplicationBuilder().token(token).rate_limiter(OutboundQueue())
+    if request is not None:
+        builder = builder.request(request).get_updates_request(request)
+    else:
+        builder = (
+            builder.connection_pool_size(CONNECTION_POOL_SIZE)
+            .pool_timeout(POOL_TIMEOUT)
+            .get_updates_connection_pool_size(1)
+        )
+    application = builder.build()
     
-    # Inject hass context AND allowed IDs
+    # Inject hass context; babies (entry id -> name, allowed IDs) are added per entry
     application.bot_data['hass'] = hass
-    application.bot_data['allowed_ids'] = allowed_ids
-    application.bot_data['entry_id'] = entry_id
-    application.bot_data['baby_name'] = baby_name
+    application.bot_data['babies'] = {}
     
     feeding_conv = ConversationHandler(
-        entry_points=[CallbackQueryHandler(main_menu_callback, pattern='^start_feeding_flow$')],
+        entry_points=[
+            CallbackQueryHandler(main_menu_callback, pattern='^start_feeding_flow$'),
+            # Conversations live in memory: the live buttons and the side choice of a
+            # stopped feeding must work after a restart too
+            CallbackQueryHandler(live_stop_handler, pattern='^(live_stop|live_switch_.*|side_.*)$'),
+        ],
         states={
             FEEDING_MENU_STATE: [CallbackQueryHandler(feeding_menu_choice, pattern='^(live_start|manual_entry|main_menu)$')],
-            LIVE_STOP_SIDE: [CallbackQueryHandler(live_stop_handler, pattern='^(live_stop|side_.*)$')],
+            LIVE_STOP_SIDE: [CallbackQueryHandler(live_stop_handler, pattern='^(live_stop|live_switch_.*|side_.*)$')],
             MANUAL_TIME: [CallbackQueryHandler(manual_time_choice, pattern='^(time_.*|main_menu)$')],
             MANUAL_DURATION: [CallbackQueryHandler(manual_duration_choice, pattern='^(dur_.*|main_menu)$')],
             MANUAL_SIDE: [CallbackQueryHandler(manual_side_choice, pattern='^side_.*$')],
@@ -490,12 +608,74 @@ async def setup_bot(hass: HomeAssistant, token: str, allowed_ids: list, entry_id
     )
 
     application.add_handler(CommandHandler('start', start))
+    application.add_handler(CommandHandler('log', log_command))
+    application.add_handler(CommandHandler('dashboard', dashboard_command))
+    application.add_handler(CallbackQueryHandler(select_baby, pattern='^baby_'))
     application.add_handler(feeding_conv)
     application.add_handler(growth_conv)
     application.add_handler(CallbackQueryHandler(main_menu_callback))
 
-    await application.initialize()
-    await application.start()
-    await application.updater.start_polling()
-    
     return application
+
+
+def add_baby(application: Application, entry_id: str, baby_name: str, allowed_ids: list):
+    """Serve one more baby (config entry) with this application."""
+    application.bot_data['babies'][entry_id] = {'name': baby_name, 'allowed_ids': allowed_ids}
+
+
+def bot_id_from_token(token: str) -> str:
+    """Return the bot's numeric id, the public part of its token."""
+    return token.split(":", 1)[0]
+
+
+class BotRegistry:
+    """One running application per Telegram bot, shared by the babies using it.
+
+    Adding a baby on an already running bot only registers it for routing; the
+    polling loop (or webhook) is started with the first baby and stopped with the last.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize."""
+        self.hass = hass
+        self.applications: dict[str, Application] = {}  # bot id -> application
+        self._lock = asyncio.Lock()
+
+    async def async_acquire(self, token: str, entry_id: str, baby_name: str, allowed_ids: list, webhook_url: str = None) -> Application:
+        """Register a baby, starting the bot if it is the first one."""
+        bot_id = bot_id_from_token(token)
+        async with self._lock:
+            if (application := self.applications.get(bot_id)) is None:
+                application = build_application(self.hass, token)
+                await application.initialize()
+                await application.start()
+                if webhook_url:
+                    await async_start_webhook(application, webhook_url, bot_id)
+                else:
+                    await application.updater.start_polling()
+                self.applications[bot_id] = application
+            add_baby(application, entry_id, baby_name, allowed_ids)
+        return application
+
+    async def async_release(self, token: str, entry_id: str):
+        """Unregister a baby, stopping the bot after the last one."""
+        bot_id = bot_id_from_token(token)
+        async with self._lock:
+            if (application := self.applications.get(bot_id)) is None:
+                return
+            application.bot_data['babies'].pop(entry_id, None)
+            if application.bot_data['babies']:
+                return
+            del self.applications[bot_id]
+            _LOGGER.info("Stopping Baby Tracker Bot...")
+            if application.updater.running:
+                await application.updater.stop()
+            if 'webhook_secret' in application.bot_data:
+                await async_stop_webhook(application)
+            await application.stop()
+            await application.shutdown()
+
+
+def get_registry(hass: HomeAssistant) -> BotRegistry:
+    """Return the integration-wide bot registry."""
+    return hass.data[DOMAIN].setdefault("bots", BotRegistry(hass))
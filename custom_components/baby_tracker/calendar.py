@@ -1,16 +1,21 @@
 """Calendar platform for Baby Tracker."""
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
-from .event_store import EventStore
+from .event_store import EventStore, to_local_naive
+from .models import BabyEvent
 
 _LOGGER = logging.getLogger(__name__)
 
+# Materialized windows kept for the dashboard's repeated week/month requests
+CACHE_SIZE = 16
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Set up the Baby Tracker calendar platform."""
     
@@ -24,6 +29,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities([BabyTrackerCalendar(store, entry)], True)
 
 
+def _to_aware(value: datetime) -> datetime:
+    """Attach HA's time zone to a stored naive local datetime."""
+    return value.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE) if value.tzinfo is None else value
+
+
 class BabyTrackerCalendar(CalendarEntity):
     """Representation of a Baby Tracker Calendar."""
 
@@ -33,6 +43,27 @@ class BabyTrackerCalendar(CalendarEntity):
         self._entry = entry
         self._attr_name = "Baby Tracker"
         self._attr_unique_id = f"{entry.entry_id}_calendar"
+        # (start, end) -> calendar events, least recently used first
+        self._cache: OrderedDict[tuple[datetime, datetime], list[CalendarEvent]] = OrderedDict()
+
+    async def async_added_to_hass(self) -> None:
+        """Drop cached windows when the store changes."""
+        self.async_on_remove(self._store.async_add_listener(self._invalidate))
+
+    @callback
+    def _invalidate(self, events: list[BabyEvent] | None):
+        """Drop the cached windows the added events fall in (all of them if None)."""
+        if events is None:
+            self._cache.clear()
+            return
+        for key in [
+            (start, end) for start, end in self._cache
+            if any(
+                (ev.start < end and ev.end > start) if ev.end else (start <= ev.start <= end)
+                for ev in events
+            )
+        ]:
+            del self._cache[key]
 
     @property
     def event(self):
@@ -41,7 +72,15 @@ class BabyTrackerCalendar(CalendarEntity):
 
     async def async_get_events(self, hass, start_date, end_date):
         """Get all events in a specific time frame."""
-        # start_date and end_date are datetime objects
+        # HA asks with aware datetimes, the store keeps naive local ones
+        start_date = to_local_naive(start_date)
+        end_date = to_local_naive(end_date)
+        await self._store.async_ensure_history()
+        key = (start_date, end_date)
+        if (cached := self._cache.get(key)) is not None:
+            self._cache.move_to_end(key)
+            return cached
+
         stored_events = self._store.get_events(start_date, end_date)
         
         calendar_events = []
@@ -49,9 +88,22 @@ class BabyTrackerCalendar(CalendarEntity):
             # BabyEvent is an object now, not a dict
             calendar_events.append(CalendarEvent(
                 summary=ev.summary,
-                start=ev.start,
-                end=ev.end if ev.end else ev.start + timedelta(minutes=1), # Ensure duration for point events
+                start=_to_aware(ev.start),
+                end=_to_aware(ev.end if ev.end else ev.start + timedelta(minutes=1)), # Ensure duration for point events
                 description=ev.description
             ))
-            
+
+        # Days past the retention period only survive as daily summaries
+        for summary in self._store.get_daily_summaries(start_date, end_date):
+            counts = summary.counts
+            calendar_events.append(CalendarEvent(
+                summary=f"📊 🍼 {counts.get('feeding', 0)} · 💩 {counts.get('poo', 0)} · 💧 {counts.get('pee', 0)}",
+                start=summary.day,
+                end=summary.day + timedelta(days=1),
+                description=f"Minuti di poppata: {summary.feeding_minutes}"
+            ))
+
+        self._cache[key] = calendar_events
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
         return calendar_events
@@ -10,8 +10,22 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.const import CONF_NAME
-
-from .const import DOMAIN, CONF_TELEGRAM_TOKEN, CONF_ALLOWED_CHAT_IDS, CONF_BABY_NAME
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    CONF_TELEGRAM_TOKEN,
+    CONF_ALLOWED_CHAT_IDS,
+    CONF_BABY_NAME,
+    CONF_RETENTION_DAYS,
+    CONF_SAVE_DELAY,
+    CONF_WEBHOOK_URL,
+    CONF_BIRTH_DATE,
+    CONF_SEX,
+    DEFAULT_RETENTION_DAYS,
+    DEFAULT_SAVE_DELAY,
+)
+from .growth import SEXES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,7 +47,9 @@ class BabyTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not token or ":" not in token:
                  errors["base"] = "invalid_auth"
             else:
-                return self.async_create_entry(title="Baby Tracker Bot", data=user_input)
+                # Entries sharing a token share one running bot, one entry per baby
+                title = f"Baby Tracker - {user_input.get(CONF_BABY_NAME) or 'Baby'}"
+                return self.async_create_entry(title=title, data=user_input)
 
         return self.async_show_form(
             step_id="user",
@@ -65,8 +81,13 @@ class BabyTrackerOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            birth_date = user_input.get(CONF_BIRTH_DATE, "").strip()
+            if birth_date and dt_util.parse_date(birth_date) is None:
+                errors["base"] = "invalid_birth_date"
+            else:
+                return self.async_create_entry(title="", data={**user_input, CONF_BIRTH_DATE: birth_date})
 
         # Robust retrieval: Look in options first, then data, then empty string default
         # The key is to handle the case where keys are MISSING entirely
@@ -85,10 +106,33 @@ class BabyTrackerOptionsFlowHandler(config_entries.OptionsFlow):
         if current_name is None: current_name = "Baby"
         current_name = str(current_name)
 
+        # 3. Raw event retention (days, 0 = forever)
+        current_retention = self.config_entry.options.get(CONF_RETENTION_DAYS, DEFAULT_RETENTION_DAYS)
+
+        # 4. Write coalescing delay (seconds)
+        current_delay = self.config_entry.options.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY)
+
+        # 5. Webhook mode: external URL of Home Assistant (empty = polling)
+        current_webhook = self.config_entry.options.get(CONF_WEBHOOK_URL, "")
+
+        # 6. Birth date and sex, for the WHO growth percentiles
+        current_birth_date = self.config_entry.options.get(CONF_BIRTH_DATE, "")
+        current_sex = self.config_entry.options.get(CONF_SEX, "")
+
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema({
                 vol.Optional(CONF_ALLOWED_CHAT_IDS, default=current_ids): str,
                 vol.Optional(CONF_BABY_NAME, default=current_name): str,
+                vol.Optional(CONF_RETENTION_DAYS, default=current_retention): vol.All(
+                    vol.Coerce(int), vol.Range(min=0)
+                ),
+                vol.Optional(CONF_SAVE_DELAY, default=current_delay): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=60)
+                ),
+                vol.Optional(CONF_WEBHOOK_URL, default=current_webhook): str,
+                vol.Optional(CONF_BIRTH_DATE, default=current_birth_date): str,
+                vol.Optional(CONF_SEX, default=current_sex): vol.In(("",) + SEXES),
             }),
+            errors=errors,
         )
@@ -4,3 +4,13 @@ DOMAIN = "baby_tracker"
 CONF_TELEGRAM_TOKEN = "telegram_token"
 CONF_ALLOWED_CHAT_IDS = "allowed_chat_ids"
 CONF_BABY_NAME = "baby_name"
+CONF_RETENTION_DAYS = "retention_days"
+CONF_SAVE_DELAY = "save_delay"
+CONF_WEBHOOK_URL = "webhook_url"  # External HA URL; empty = long polling
+CONF_BIRTH_DATE = "birth_date"  # YYYY-MM-DD, for growth percentiles
+CONF_SEX = "sex"  # "male" / "female", for growth percentiles
+
+ATTR_ENTRY_ID = "entry_id"  # Service field: config entry of the baby to act on
+
+DEFAULT_RETENTION_DAYS = 0  # Keep raw events forever
+DEFAULT_SAVE_DELAY = 2  # Seconds new events wait so bursts reach disk in one write
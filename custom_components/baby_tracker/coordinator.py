@@ -2,65 +2,240 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
 from .event_store import EventStore
+from .growth import series_percentiles
+from .models import GROWTH_METRICS, BabyEvent, FeedingSession
+from .stats import AVERAGE_WINDOWS, CATEGORIES, daily_averages, growth_velocity
 
 _LOGGER = logging.getLogger(__name__)
 
+# The live feeding session is a tiny record kept apart from the event history
+SESSION_STORAGE_KEY = "baby_tracker_session"
+SESSION_STORAGE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class BabyTrackerData:
+    """Immutable snapshot of the tracker state, computed once per update."""
+
+    counts: Mapping[str, int]
+    last_events: Mapping[str, BabyEvent | None]
+    is_feeding: bool
+    feeding_start_time: datetime | None
+    feeding_started_by: str | None
+    daily_totals: Mapping[str, int]
+    averages: Mapping[int, Mapping[str, float]]  # Window in days -> per-day averages
+    last_side: str | None  # Side of the last single-side breastfeeding
+    # Metric -> value, measured_at, velocity_per_week, z_score, percentile, series,
+    # percentiles (z-score, percentile of each point of the series)
+    growth: Mapping[str, Mapping]
+
+
 class BabyTrackerCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching data from the API and internal state."""
+    """Class to manage fetching data from the API and internal state.
+
+    Push only: every mutation publishes a new snapshot. The only timer wakes the
+    coordinator when the snapshot goes stale on its own, i.e. when the next event
+    leaves the last-24h window or at midnight, whichever comes first.
+    """
 
-    def __init__(self, hass: HomeAssistant, store: EventStore) -> None:
-        """Initialize."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        store: EventStore,
+        birth_date: date | None = None,
+        sex: str | None = None,
+    ) -> None:
+        """Initialize (birth date and sex enable growth percentiles)."""
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=10),
         )
         self.store = store
-        
-        # Internal State (Replacing Helpers)
-        self.is_feeding = False
-        self.feeding_start_time = None
-        self.last_feeding_side = None
-        self.last_feeding_duration = 0
-
-    async def _async_update_data(self):
+        self.birth_date = birth_date
+        self.sex = sex
+        self._unsub_expiry = None
+
+        # Live feeding timer (replacing helpers), see async_restore_session
+        self.session: FeedingSession | None = None
+        self._session_store = Store(
+            hass, SESSION_STORAGE_VERSION, f"{SESSION_STORAGE_KEY}_{store.entry_id}"
+        )
+
+    @property
+    def is_feeding(self) -> bool:
+        """Return True while a live feeding is running (not stopped)."""
+        return self.session is not None and self.session.stopped_at is None
+
+    @property
+    def feeding_start_time(self) -> datetime | None:
+        """Return the start of the live feeding, if any."""
+        return self.session.start if self.is_feeding else None
+
+    async def _async_update_data(self) -> BabyTrackerData:
         """Fetch data from store."""
         if not self.store.last_load:
             await self.store.async_load()
-        return self.store.events
+        return self._build_snapshot()
+
+    def _build_snapshot(self) -> BabyTrackerData:
+        """Compute the state shared by all entities for this update."""
+        now = datetime.now()
+        today = now.date()
+        self._schedule_expiry(now)
+
+        daily_totals = dict.fromkeys(CATEGORIES, 0)
+        daily_totals["feeding_minutes"] = 0
+        for summary in self.store.get_daily_stats(today, today):
+            daily_totals.update(summary.counts)
+            daily_totals["feeding_minutes"] = summary.feeding_minutes
+
+        # Averages over the last complete days, today excluded
+        yesterday = today - timedelta(days=1)
+        averages = {
+            days: MappingProxyType(daily_averages(
+                self.store.get_daily_stats(today - timedelta(days=days), yesterday)
+            ))
+            for days in AVERAGE_WINDOWS
+        }
+
+        return BabyTrackerData(
+            counts=MappingProxyType(self.store.get_stats_last_24h()),
+            last_events=MappingProxyType(self.store.get_last_events()),
+            is_feeding=self.is_feeding,
+            feeding_start_time=self.feeding_start_time,
+            feeding_started_by=self.session.started_by if self.is_feeding else None,
+            daily_totals=MappingProxyType(daily_totals),
+            averages=MappingProxyType(averages),
+            last_side=self.store.get_last_breast_side(),
+            growth=MappingProxyType({
+                metric: self._growth_snapshot(metric) for metric in GROWTH_METRICS
+            }),
+        )
+
+    def _growth_snapshot(self, metric: str) -> Mapping:
+        """Summarize the time series of a growth metric."""
+        series = self.store.get_growth_series(metric)
+        latest_at, latest = series[-1] if series else (None, None)
+        if self.birth_date and self.sex:
+            percentiles = tuple(series_percentiles(metric, self.sex, self.birth_date, series))
+        else:
+            percentiles = ((None, None),) * len(series)
+        z_score, percentile = percentiles[-1] if percentiles else (None, None)
+        return MappingProxyType({
+            "value": latest,
+            "measured_at": latest_at,
+            "velocity_per_week": growth_velocity(series),
+            "z_score": z_score,
+            "percentile": percentile,
+            "series": tuple(series),
+            "percentiles": percentiles,
+        })
+
+    def _schedule_expiry(self, now: datetime):
+        """Schedule a single wake-up for when the snapshot being built goes stale."""
+        if self._unsub_expiry:
+            self._unsub_expiry()
+        wake_up = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        if (expiry := self.store.get_next_24h_expiry()) and expiry < wake_up:
+            wake_up = expiry
+        self._unsub_expiry = async_call_later(
+            self.hass, max((wake_up - now).total_seconds(), 0), self._async_handle_expiry
+        )
+
+    @callback
+    def _async_handle_expiry(self, _now: datetime):
+        """Publish a fresh snapshot now that the old one is stale."""
+        self._unsub_expiry = None
+        self.async_set_updated_data(self._build_snapshot())
+
+    async def async_shutdown(self) -> None:
+        """Cancel the expiry timer too."""
+        await super().async_shutdown()
+        if self._unsub_expiry:
+            self._unsub_expiry()
+            self._unsub_expiry = None
 
     async def async_add_event(self, event):
         """Add an event and notify listeners."""
         await self.store.add_event(event)
-        self.async_set_updated_data(self.store.events)
+        self.async_set_updated_data(self._build_snapshot())
+
+    async def async_add_events(self, events):
+        """Add a batch of events with a single store write and update."""
+        await self.store.add_events(events)
+        self.async_set_updated_data(self._build_snapshot())
 
     # --- State Management Actions ---
 
-    def start_feeding(self):
+    async def async_restore_session(self):
+        """Restore the live feeding that was running before a restart or reload."""
+        if (data := await self._session_store.async_load()) and data.get("session"):
+            self.session = FeedingSession.from_dict(data["session"])
+            if self.session:
+                _LOGGER.info(
+                    "Restored %s feeding started at %s",
+                    "stopped" if self.session.stopped_at else "live", self.session.start
+                )
+
+    def _save_session(self):
+        """Persist the live feeding session (a few bytes, written on change only)."""
+        self._session_store.async_delay_save(
+            lambda: {"session": self.session.to_dict() if self.session else None}, 0
+        )
+
+    def start_feeding(self, started_by: str | None = None):
         """Start the feeding timer."""
-        self.is_feeding = True
-        self.feeding_start_time = datetime.now()
-        self.async_set_updated_data(self.store.events) # Trigger update
+        if self.session and self.session.stopped_at:
+            # A stopped feeding still waiting for its side is written without one
+            self.hass.async_create_task(self.async_add_event(self.session.to_event(None)))
+        self.session = FeedingSession(datetime.now(), started_by)
+        self._save_session()
+        self.async_set_updated_data(self._build_snapshot()) # Trigger update
+
+    def switch_side(self, side: str):
+        """Record a side switch during the live feeding."""
+        if not self.is_feeding:
+            return
+        self.session.side_switches.append((datetime.now(), side))
+        self._save_session()
 
-    def stop_feeding(self):
-        """Stop the feeding timer."""
-        self.is_feeding = False
-        self.async_set_updated_data(self.store.events)
+    def stop_feeding(self) -> FeedingSession | None:
+        """Stop the feeding timer; the session is kept until async_log_stopped_feeding."""
+        if not self.is_feeding:
+            return None
+        self.session.stopped_at = datetime.now()
+        self._save_session()
+        self.async_set_updated_data(self._build_snapshot())
+        return self.session
 
-    def set_feeding_data(self, side, duration):
-        """Update last feeding transient data."""
-        self.last_feeding_side = side
-        self.last_feeding_duration = duration
-        # No need to trigger update here usually, as add_event follows
+    async def async_log_stopped_feeding(self, side: str | None) -> BabyEvent | None:
+        """Write the stopped feeding's event, then drop the persisted session."""
+        session = self.session
+        if not (session and session.stopped_at):
+            return None
+        event = session.to_event(side)
+        await self.store.add_event(event)
+        # On disk before the session is forgotten
+        await self.store.async_flush()
+        if self.session is session:
+            self.session = None
+            self._save_session()
+        self.async_set_updated_data(self._build_snapshot())
+        return event
 
     def get_todays_counts(self):
-        """Get counts for today from store."""
-        return self.store.get_stats_last_24h() # We can reuse or specialize this
+        """Get the last-24h counts of the current snapshot."""
+        return self.data.counts
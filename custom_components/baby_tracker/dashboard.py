@@ -0,0 +1,198 @@
+"""Live status dashboard for the Baby Tracker bot.
+
+Each chat that asks for it gets one pinned status message, re-rendered from the
+coordinator's snapshot whenever the data changes. Edits are coalesced per chat:
+a burst of events produces at most one edit every EDIT_INTERVAL seconds.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from functools import partial
+
+from telegram import Bot
+from telegram.error import BadRequest, TelegramError
+from telegram.helpers import escape_markdown
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+
+from .coordinator import BabyTrackerCoordinator, BabyTrackerData
+from .models import GROWTH_METRICS, BabyEvent
+
+_LOGGER = logging.getLogger(__name__)
+
+DASHBOARD_STORAGE_KEY = "baby_tracker_dashboard"
+DASHBOARD_STORAGE_VERSION = 1
+
+GROWTH_LABELS = {"weight": "⚖️ **Peso**", "height": "📏 **Altezza**", "head": "🧠 **Circonferenza**"}
+
+# BadRequest messages meaning the dashboard message is gone for good
+GONE_ERRORS = ("message to edit not found", "chat not found")
+
+# Minimum seconds between two edits of the same message (Telegram allows ~1/s per chat)
+EDIT_INTERVAL = 10
+
+
+def _fmt_ago(event: BabyEvent | None, now: datetime) -> str:
+    """Format the age of an event (from its end, if any)."""
+    if not event:
+        return "Mai"
+    mins = int((now - (event.end or event.start)).total_seconds() / 60)
+    if mins < 60:
+        return f"{mins} min fa"
+    return f"{mins // 60}h {mins % 60}m fa"
+
+
+def _fmt_growth(metric: str, growth: Mapping) -> str:
+    """Format the latest measurement of a growth metric, with its WHO percentile."""
+    line = f"{GROWTH_LABELS[metric]}: {growth['value']:g} {GROWTH_METRICS[metric]}"
+    if growth["percentile"] is not None:
+        line += f" (P{growth['percentile']:.0f})"
+    return line
+
+
+def render_status(data: BabyTrackerData, now: datetime | None = None, baby_name: str | None = None) -> str:
+    """Render the last-24h status text (Markdown) from a coordinator snapshot."""
+    now = now or datetime.now()
+    counts, last_events = data.counts, data.last_events
+    last_feeding = last_events.get("feeding")
+    # User text (names, notes) must not break the Markdown entities
+    text = (
+        f"📊 **{escape_markdown(baby_name)} - Ultime 24h**\n\n" if baby_name else "📊 **Statistiche Ultime 24h**\n\n"
+    )
+    if data.is_feeding:
+        mins = int((now - data.feeding_start_time).total_seconds() / 60)
+        text += f"⏱️ **Poppata in corso** da {mins} min\n\n"
+    text += (
+        f"🍼 **Poppate**: {counts.get('feeding', 0)}\n"
+        f"   🕒 Ultima: {_fmt_ago(last_feeding, now)}\n"
+        f"   📝 {escape_markdown(last_feeding.description) if last_feeding else ''}\n\n"
+
+        f"💩 **Cacche**: {counts.get('poo', 0)}\n"
+        f"   🕒 Ultima: {_fmt_ago(last_events.get('poo'), now)}\n"
+
+        f"💧 **Pipì**: {counts.get('pee', 0)}\n"
+        f"   🕒 Ultima: {_fmt_ago(last_events.get('pee'), now)}\n"
+    )
+    growth_lines = [
+        _fmt_growth(metric, data.growth[metric]) for metric in GROWTH_METRICS
+        if data.growth[metric]["value"] is not None
+    ]
+    if growth_lines:
+        text += "\n" + "\n".join(growth_lines) + "\n"
+    return text
+
+
+
+class LiveDashboard:
+    """Pinned status messages, one per chat, kept in sync with the coordinator."""
+
+    def __init__(self, hass: HomeAssistant, bot: Bot, coordinator: BabyTrackerCoordinator, entry_id: str, baby_name: str | None = None):
+        """Initialize."""
+        self.hass = hass
+        self.bot = bot
+        self.coordinator = coordinator
+        self.baby_name = baby_name
+        self._store = Store(hass, DASHBOARD_STORAGE_VERSION, f"{DASHBOARD_STORAGE_KEY}_{entry_id}")
+        self._messages: dict[int, int] = {}  # chat id -> pinned message id
+        self._last_text: dict[int, str] = {}
+        self._last_edit: dict[int, float] = {}  # chat id -> monotonic time
+        self._unsub_edits: dict[int, callable] = {}  # chat id -> pending coalesced edit
+        self._unsub_coordinator = None
+
+    async def async_start(self):
+        """Restore the pinned messages and follow the coordinator."""
+        data = await self._store.async_load() or {}
+        self._messages = {int(chat_id): message_id for chat_id, message_id in data.get("messages", {}).items()}
+        self._unsub_coordinator = self.coordinator.async_add_listener(self._handle_update)
+        # Data may have changed while we were down
+        self._handle_update()
+
+    async def async_stop(self):
+        """Stop following the coordinator and drop pending edits."""
+        if self._unsub_coordinator:
+            self._unsub_coordinator()
+            self._unsub_coordinator = None
+        for unsub in self._unsub_edits.values():
+            unsub()
+        self._unsub_edits.clear()
+
+    def _save(self):
+        self._store.async_delay_save(lambda: {"messages": self._messages}, 0)
+
+    async def async_pin(self, chat_id: int):
+        """Send a fresh status message to a chat and pin it as its dashboard."""
+        text = render_status(self.coordinator.data, baby_name=self.baby_name)
+        message = await self.bot.send_message(chat_id, text, parse_mode='Markdown')
+        if old_message_id := self._messages.get(chat_id):
+            await self._async_unpin_message(chat_id, old_message_id)
+        try:
+            await self.bot.pin_chat_message(chat_id, message.message_id, disable_notification=True)
+        except TelegramError as err:
+            # e.g. no pin rights in a group: the message is still kept up to date
+            _LOGGER.warning("Could not pin the dashboard in chat %s: %s", chat_id, err)
+        self._messages[chat_id] = message.message_id
+        self._last_text[chat_id] = text
+        self._last_edit[chat_id] = time.monotonic()
+        self._save()
+
+    async def async_unpin(self, chat_id: int) -> bool:
+        """Stop updating a chat's dashboard. Returns False if it had none."""
+        if (message_id := self._messages.pop(chat_id, None)) is None:
+            return False
+        if unsub := self._unsub_edits.pop(chat_id, None):
+            unsub()
+        self._last_text.pop(chat_id, None)
+        self._save()
+        await self._async_unpin_message(chat_id, message_id)
+        return True
+
+    async def _async_unpin_message(self, chat_id: int, message_id: int):
+        try:
+            await self.bot.unpin_chat_message(chat_id, message_id)
+        except TelegramError as err:
+            _LOGGER.debug("Could not unpin message %s in chat %s: %s", message_id, chat_id, err)
+
+    @callback
+    def _handle_update(self):
+        """Schedule an edit for every dashboard, coalescing with pending ones."""
+        for chat_id in self._messages:
+            if chat_id in self._unsub_edits:
+                continue
+            wait = self._last_edit.get(chat_id, 0) + EDIT_INTERVAL - time.monotonic()
+            self._unsub_edits[chat_id] = async_call_later(
+                self.hass, max(wait, 0), partial(self._async_edit, chat_id)
+            )
+
+    async def _async_edit(self, chat_id: int, _now):
+        """Re-render a dashboard from the latest snapshot."""
+        self._unsub_edits.pop(chat_id, None)
+        if (message_id := self._messages.get(chat_id)) is None or self.coordinator.data is None:
+            return
+        text = render_status(self.coordinator.data, baby_name=self.baby_name)
+        if text == self._last_text.get(chat_id):
+            return
+        self._last_edit[chat_id] = time.monotonic()
+        try:
+            await self.bot.edit_message_text(text, chat_id=chat_id, message_id=message_id, parse_mode='Markdown')
+        except BadRequest as err:
+            message = str(err).lower()
+            if "not modified" in message:
+                self._last_text[chat_id] = text
+            elif any(gone in message for gone in GONE_ERRORS):
+                # The message was deleted (or the bot removed from the chat)
+                _LOGGER.info("Dropping the dashboard of chat %s: %s", chat_id, err)
+                self._messages.pop(chat_id, None)
+                self._last_text.pop(chat_id, None)
+                self._save()
+            else:
+                # e.g. a parse error: keep the message, the next update retries
+                _LOGGER.warning("Could not update the dashboard in chat %s: %s", chat_id, err)
+        except TelegramError as err:
+            _LOGGER.warning("Could not update the dashboard in chat %s: %s", chat_id, err)
+        else:
+            self._last_text[chat_id] = text
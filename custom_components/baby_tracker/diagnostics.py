@@ -20,12 +20,23 @@ async def async_get_config_entry_diagnostics(
 
     # Get Bot status/info if available
     bot_info = {}
-    if app := hass.data[DOMAIN].get(entry.entry_id):
+    if app := hass.data[DOMAIN].get(entry.entry_id + "_bot"):
         # Basic info about bot connection is tricky to get deep inside PTB
         # but we can check if updater is running
         bot_info = {
-            "running": app.updater.running,
-            "bot_id": app.bot.id if app.bot else "Unknown"
+            "running": app.updater.running or app.running,
+            "mode": "webhook" if "webhook_secret" in app.bot_data else "polling",
+            "bot_id": app.bot.id if app.bot else "Unknown",
+            # Babies (config entries) sharing this bot
+            "babies": len(app.bot_data.get('babies', {})),
+        }
+
+    # Startup timings: recent window parsed during setup vs history in the executor
+    store_info = {}
+    if store := hass.data[DOMAIN].get(entry.entry_id + "_store"):
+        store_info = {
+            "events": len(store.events),
+            "load_stats": store.load_stats,
         }
 
     return {
@@ -34,4 +45,5 @@ async def async_get_config_entry_diagnostics(
             "options": options,
         },
         "bot_info": bot_info,
+        "store": store_info,
     }
@@ -1,117 +1,573 @@
 """Persistent storage for Baby Tracker events (v2.0)."""
+import asyncio
+import heapq
+import json
 import logging
-from datetime import datetime, timedelta
-from homeassistant.helpers.storage import Store
-from homeassistant.core import HomeAssistant
+import os
+import re
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from itertools import pairwise
+from operator import attrgetter, itemgetter
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store, STORAGE_DIR
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
 
-from .models import BabyEvent
+from .const import DEFAULT_SAVE_DELAY
+from .models import FEEDING_SIDES, BabyEvent, DailySummary
+from .stats import CATEGORIES, RollingWindowStats
 
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "baby_tracker_events"
 STORAGE_VERSION = 2  # Bumping version to indicate new schema if needed
+STORAGE_MINOR_VERSION = 3  # 2: events carry precomputed categories, 3: typed feeding fields
+
+# Number of journaled events after which the journal is folded into the snapshot
+JOURNAL_COMPACT_THRESHOLD = 200
+
+# Events this recent are parsed during setup; older history is parsed in the executor
+RECENT_WINDOW = timedelta(days=7)
+
+def legacy_categories(record: dict) -> list[str]:
+    """Classify a stored event the way pre-typed data was matched on its summary."""
+    event_type = record.get("type")
+    summary = record.get("summary", "")
+    categories = []
+    if event_type == "feeding" or "Poppata" in summary:
+        categories.append("feeding")
+    if event_type == "poo" or "Cacca" in summary or "Misto" in summary:
+        categories.append("poo")
+    if event_type == "pee" or "Pipì" in summary or "Misto" in summary:
+        categories.append("pee")
+    # A typed mixed change may predate the "Misto" summary
+    if event_type == "diaper" and not {"poo", "pee"} & set(categories):
+        categories.extend(("poo", "pee"))
+    if event_type in ("growth", "sleep"):
+        categories.append(event_type)
+    return categories
+
+
+# Feedings were logged with a free-text "Lato: sx, Durata: 15 min" description
+_LEGACY_SIDE_RE = re.compile(r"Lato: (\w+)")
+_LEGACY_DURATION_RE = re.compile(r"Durata: (\d+) min")
+
+
+def backfill_feeding(record: dict):
+    """Fill the typed feeding fields of a stored event from its legacy description."""
+    if "feeding" not in record.get("categories", ()):
+        return
+    description = record.get("description") or ""
+    if (match := _LEGACY_SIDE_RE.search(description)) and match.group(1) in FEEDING_SIDES:
+        record["side"] = match.group(1)
+    if match := _LEGACY_DURATION_RE.search(description):
+        record["duration_s"] = int(match.group(1)) * 60
+
+
+# Key of the latest single-side breastfeeding in the "last" indexes, next to the categories
+LAST_BREAST_KEY = "breast_side"
+
+
+def _last_keys(event: BabyEvent) -> tuple[str, ...]:
+    """Keys of the "last" indexes the event may be the latest of."""
+    if event.side in ("sx", "dx"):
+        return (*event.categories, LAST_BREAST_KEY)
+    return event.categories
+
+
+def to_local_naive(value: datetime) -> datetime:
+    """Convert an aware datetime to the naive local time the store uses."""
+    return dt_util.as_local(value).replace(tzinfo=None) if value.tzinfo else value
+
+
+def _record_start(record: dict) -> str:
+    """Sort key for stored records: ISO strings order like the datetimes they encode."""
+    return record.get("start") or ""
+
+
+class _EventStorage(Store):
+    """Store with migrations for the events file."""
+
+    async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
+        """Normalize legacy events into canonical categories once."""
+        if old_major_version > STORAGE_VERSION:
+            raise NotImplementedError
+        if old_minor_version < 2 or old_major_version < STORAGE_VERSION:
+            for record in old_data.get("events", []):
+                record["categories"] = legacy_categories(record)
+        if old_minor_version < 3 or old_major_version < STORAGE_VERSION:
+            for record in old_data.get("events", []):
+                backfill_feeding(record)
+        return old_data
+
 
 class EventStore:
     """Class to handle storage of baby tracker events."""
 
-    def __init__(self, hass: HomeAssistant, entry_id: str):
-        """Initialize the storage."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        retention_days: int = 0,
+        save_delay: float = DEFAULT_SAVE_DELAY,
+    ):
+        """Initialize the storage.
+
+        With retention_days > 0, raw events older than that many days are folded into
+        per-day summaries when the snapshot is written (0 keeps raw events forever).
+        New events are journaled in one batch save_delay seconds after the first.
+        """
         self.hass = hass
         self.entry_id = entry_id
-        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry_id}")
+        self.retention_days = retention_days
+        self.save_delay = save_delay
+        self._store = _EventStorage(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry_id}", minor_version=STORAGE_MINOR_VERSION
+        )
+        self._journal_path = hass.config.path(STORAGE_DIR, f"{STORAGE_KEY}_{entry_id}.journal")
+        self._journal_lock = asyncio.Lock()
+        # Sequence numbers: last record appended to the journal / last folded into the snapshot
+        self._journal_seq = 0
+        self._snapshot_seq = 0
+        # Journal records waiting for the scheduled flush
+        self._pending: list[dict] = []
+        self._unsub_flush = None
+        self._unsub_final_write = None
+        # Events are kept sorted by start; _starts mirrors them for bisection and
+        # _max_span (the longest event) bounds how far back an overlap can begin.
         self.events: list[BabyEvent] = []
+        self._starts: list[datetime] = []
+        self._max_span = timedelta(0)
+        self._last_24h = RollingWindowStats(timedelta(hours=24))
+        self._last_by_category: dict[str, BabyEvent] = {}
+        # Per-day rollup of every day, updated on add. Days in _compacted_days have
+        # no raw events left (retention tier), so their rollup is what gets persisted,
+        # together with the latest compacted event per category.
+        self.daily_rollup: dict[date, DailySummary] = {}
+        self._compacted_days: set[date] = set()
+        self._compacted_last: dict[str, BabyEvent] = {}
+        # Growth measurements: per-metric (time, value) series sorted by time. Growth
+        # events past retention are few, so they are kept whole in _compacted_growth.
+        self._growth: dict[str, list[tuple[datetime, float]]] = {}
+        self._compacted_growth: list[BabyEvent] = []
+        self._history_task: asyncio.Task | None = None
+        # Change listeners, see async_add_listener
+        self._listeners: list[Callable[[list[BabyEvent] | None], None]] = []
+        self.load_stats: dict[str, float] = {}
         self.last_load = None
 
     async def async_load(self):
-        """Load data from storage with validation."""
+        """Load the snapshot and replay the journal on top of it.
+
+        Only the last RECENT_WINDOW of the snapshot is parsed here; older history is
+        parsed in the executor by a background task (see async_ensure_history).
+        """
+        started = time.perf_counter()
         raw_data = await self._store.async_load()
-        self.events = []
-        
+        self._snapshot_seq = 0
+        self.daily_rollup = {}
+        self._compacted_days = set()
+        self._compacted_last = {}
+        self._compacted_growth = []
+        records = []
+
         if raw_data and "events" in raw_data:
-            for ev_dict in raw_data["events"]:
-                # Try to parse into model
-                event = BabyEvent.from_dict(ev_dict)
-                if event:
-                    self.events.append(event)
-                else:
-                    _LOGGER.warning("Skipping corrupted event: %s", ev_dict)
-        
+            self._snapshot_seq = raw_data.get("seq", 0)
+            for summary_dict in raw_data.get("daily", []):
+                if summary := DailySummary.from_dict(summary_dict):
+                    self.daily_rollup[summary.day] = summary
+                    self._compacted_days.add(summary.day)
+            for category, ev_dict in raw_data.get("last", {}).items():
+                if event := BabyEvent.from_dict(ev_dict):
+                    self._compacted_last[category] = event
+            self._compacted_growth = self._parse_records(raw_data.get("growth", []))
+            records = raw_data["events"]
+            if any(_record_start(a) > _record_start(b) for a, b in pairwise(records)):
+                records.sort(key=_record_start)
+
+        split = bisect_left(records, (datetime.now() - RECENT_WINDOW).isoformat(), key=_record_start)
+        self.events = self._parse_records(records[split:])
+
+        # Records already folded into the snapshot are skipped: this covers a crash
+        # between writing the snapshot and truncating the journal.
+        self._journal_seq = self._snapshot_seq
+        replayed = 0
+        for record in await self.hass.async_add_executor_job(self._read_journal):
+            if record["seq"] <= self._snapshot_seq:
+                continue
+            if "categories" not in record["event"]:
+                record["event"]["categories"] = legacy_categories(record["event"])
+            if "duration_s" not in record["event"]:
+                backfill_feeding(record["event"])
+            event = BabyEvent.from_dict(record["event"])
+            if event:
+                self.events.append(event)
+                replayed += 1
+            else:
+                _LOGGER.warning("Skipping corrupted journal event: %s", record)
+            self._journal_seq = max(self._journal_seq, record["seq"])
+
+        if replayed:
+            _LOGGER.debug("Replayed %s events from journal", replayed)
+        self._rebuild_index()
+        self._last_24h.reset(self.events)
+        for event in self.events:
+            self._rollup_add(event)
+        self._rebuild_last_index()
+        self._rebuild_growth_index()
         self.last_load = datetime.now()
+        if self._unsub_final_write is None:
+            self._unsub_final_write = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+            )
+        self.load_stats = {
+            "recent_events": len(self.events),
+            "recent_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        _LOGGER.debug("Loaded %s recent events in %s ms", len(self.events), self.load_stats["recent_ms"])
+
+        if split:
+            self._history_task = self.hass.async_create_background_task(
+                self._async_load_history(records[:split]), f"{STORAGE_KEY}_{self.entry_id}_history"
+            )
+        else:
+            self.load_stats.update(history_events=0, history_ms=0)
+            await self._async_compact_if_needed()
+
+    async def _async_load_history(self, records: list[dict]):
+        """Parse older history off the event loop and merge it in."""
+        started = time.perf_counter()
+        older = await self.hass.async_add_executor_job(self._parse_records, records)
+        # Both runs are sorted, so this sort is a linear merge
+        self.events = older + self.events
+        self._rebuild_index()
+        for event in older:
+            self._rollup_add(event)
+        self._rebuild_last_index()
+        self._rebuild_growth_index()
+        self._history_task = None
+        self._notify_listeners(None)
+        self.load_stats.update(
+            history_events=len(older),
+            history_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+        _LOGGER.debug("Loaded %s history events in %s ms", len(older), self.load_stats["history_ms"])
+        await self._async_compact_if_needed()
+
+    async def async_ensure_history(self):
+        """Wait until older history has been merged in."""
+        if self._history_task:
+            await asyncio.shield(self._history_task)
+
+    @staticmethod
+    def _parse_records(records: list[dict]) -> list[BabyEvent]:
+        """Parse stored records into events, skipping corrupted ones."""
+        events = []
+        for ev_dict in records:
+            event = BabyEvent.from_dict(ev_dict)
+            if event:
+                events.append(event)
+            else:
+                _LOGGER.warning("Skipping corrupted event: %s", ev_dict)
+        return events
+
+    async def _async_compact_if_needed(self):
+        """Fold the journal once it has grown past the threshold or events expired."""
+        if (
+            self._journal_seq - self._snapshot_seq >= JOURNAL_COMPACT_THRESHOLD
+            or (self.events and self.events[0].start < self._retention_cutoff())
+        ):
+            await self.async_save()
 
     async def async_save(self):
-        """Save data to storage."""
-        data = {
-            "events": [ev.to_dict() for ev in self.events]
-        }
-        await self._store.async_save(data)
+        """Fold the journal into a full snapshot and truncate it."""
+        await self.async_ensure_history()
+        async with self._journal_lock:
+            # Pending records are covered by the snapshot
+            self._pending.clear()
+            self._apply_retention()
+            seq = self._journal_seq
+            # Events, summaries, compacted "last" and growth events share one atomic write
+            data = {
+                "seq": seq,
+                "events": [ev.to_dict() for ev in self.events],
+                "daily": [self.daily_rollup[day].to_dict() for day in sorted(self._compacted_days)],
+                "last": {category: ev.to_dict() for category, ev in self._compacted_last.items()},
+                "growth": [ev.to_dict() for ev in self._compacted_growth],
+            }
+            await self._store.async_save(data)
+            self._snapshot_seq = seq
+            await self.hass.async_add_executor_job(self._truncate_journal)
 
     async def add_event(self, event: BabyEvent):
-        """Add a new event."""
-        self.events.append(event)
-        await self.async_save()
+        """Add a new event; it reaches the journal with the next scheduled flush."""
+        await self.add_events([event])
         _LOGGER.debug("Added event: %sMs", event)
 
+    async def add_events(self, events: list[BabyEvent]):
+        """Add several events, journaled together in one write."""
+        for event in events:
+            self._insert(event)
+            self._last_24h.add(event)
+            self._update_last_index(event)
+            self._update_growth_index(event)
+            self._rollup_add(event)
+            self._journal_seq += 1
+            self._pending.append({"seq": self._journal_seq, "event": event.to_dict()})
+        self._schedule_flush()
+        self._notify_listeners(events)
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[list[BabyEvent] | None], None]) -> Callable[[], None]:
+        """Listen for changes to the events; returns a function to stop listening.
+
+        The callback gets the added events, or None when any range may have changed
+        (history merged in, raw events compacted).
+        """
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    def _notify_listeners(self, events: list[BabyEvent] | None):
+        for update_callback in self._listeners:
+            update_callback(events)
+
+    @callback
+    def _schedule_flush(self):
+        """Coalesce writes: one flush per save_delay however many events arrive."""
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self.hass, self.save_delay, self._async_scheduled_flush)
+
+    async def _async_scheduled_flush(self, _now):
+        """Run the flush scheduled by _schedule_flush."""
+        self._unsub_flush = None
+        await self.async_flush()
+
+    async def async_flush(self, compact: bool = True):
+        """Append pending events to the journal now, compacting it if due.
+
+        Bulk writers pass compact=False and call async_save once at the end.
+        """
+        if self._unsub_flush:
+            self._unsub_flush()
+            self._unsub_flush = None
+        async with self._journal_lock:
+            if self._pending:
+                records, self._pending = self._pending, []
+                await self.hass.async_add_executor_job(self._append_journal, records)
+        if compact:
+            await self._async_compact_if_needed()
+
+    async def _async_final_write(self, _event: Event):
+        """Flush pending events when Home Assistant stops."""
+        self._unsub_final_write = None
+        await self.async_flush()
+
+    async def async_unload(self):
+        """Flush pending events and stop listening for shutdown."""
+        if self._unsub_final_write:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+        await self.async_flush()
+
+    def _retention_cutoff(self) -> datetime:
+        """Return the start of the oldest day whose raw events are kept."""
+        if not self.retention_days:
+            return datetime.min
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        return today - timedelta(days=self.retention_days)
+
+    def _apply_retention(self):
+        """Drop raw events older than the retention period, keeping their days' rollup."""
+        split = bisect_left(self._starts, self._retention_cutoff())
+        if not split:
+            return
+        expired = self.events[:split]
+        for event in expired:
+            self._compacted_days.add(event.start.date())
+            if event.metric:
+                self._compacted_growth.append(event)
+            for key in _last_keys(event):
+                current = self._compacted_last.get(key)
+                if current is None or event.start >= current.start:
+                    self._compacted_last[key] = event
+        del self.events[:split]
+        del self._starts[:split]
+        self._notify_listeners(None)
+        _LOGGER.debug("Folded %s events into daily summaries", split)
+
+    def _rollup_add(self, event: BabyEvent):
+        """Account for an event in its day's rollup."""
+        day = event.start.date()
+        summary = self.daily_rollup.get(day)
+        if summary is None:
+            summary = self.daily_rollup[day] = DailySummary(day)
+        summary.add(event)
+
+    def _rebuild_growth_index(self):
+        """Rebuild the per-metric growth series from compacted and raw events."""
+        self._growth = {}
+        for event in self._compacted_growth + self.events:
+            self._update_growth_index(event)
+
+    def _update_growth_index(self, event: BabyEvent):
+        """Add a growth measurement to its metric's series."""
+        if event.metric and event.value is not None:
+            insort(self._growth.setdefault(event.metric, []), (event.start, event.value))
+
+    def _rebuild_index(self):
+        """Sort events by start and rebuild the interval index."""
+        self.events.sort(key=attrgetter("start"))
+        self._starts = [ev.start for ev in self.events]
+        self._max_span = max(
+            [timedelta(0)] + [ev.end - ev.start for ev in self.events if ev.end]
+        )
+
+    def _insert(self, event: BabyEvent):
+        """Insert an event keeping start order (back-dated entries included)."""
+        idx = bisect_right(self._starts, event.start)
+        self._starts.insert(idx, event.start)
+        self.events.insert(idx, event)
+        if event.end and event.end - event.start > self._max_span:
+            self._max_span = event.end - event.start
+
+    def _rebuild_last_index(self):
+        """Find the latest event of each category, walking back only as far as needed.
+
+        The rollups of the raw days tell which keys the raw events hold, so the
+        walk stops once all of them are found instead of at the oldest event.
+        """
+        wanted = set()
+        for day, summary in self.daily_rollup.items():
+            if day not in self._compacted_days:
+                wanted.update(category for category, count in summary.counts.items() if count)
+                if summary.sides.get("sx") or summary.sides.get("dx"):
+                    wanted.add(LAST_BREAST_KEY)
+        self._last_by_category = {}
+        for event in reversed(self.events):
+            if not wanted:
+                break
+            for key in _last_keys(event):
+                self._last_by_category.setdefault(key, event)
+                wanted.discard(key)
+        for key, event in self._compacted_last.items():
+            self._last_by_category.setdefault(key, event)
+
+    def _update_last_index(self, event: BabyEvent):
+        """Record the event as latest of its categories unless a newer one exists."""
+        for key in _last_keys(event):
+            current = self._last_by_category.get(key)
+            if current is None or event.start >= current.start:
+                self._last_by_category[key] = event
+
+    def _append_journal(self, records: list[dict]):
+        """Append records to the journal file (executor)."""
+        os.makedirs(os.path.dirname(self._journal_path), exist_ok=True)
+        with open(self._journal_path, "a", encoding="utf-8") as journal:
+            for record in records:
+                journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def _read_journal(self) -> list[dict]:
+        """Read all intact records from the journal file (executor)."""
+        records = []
+        try:
+            with open(self._journal_path, encoding="utf-8") as journal:
+                for line in journal:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn trailing line from a crash mid-write
+                        _LOGGER.warning("Skipping unreadable journal record: %s", line.strip())
+                        continue
+                    if isinstance(record, dict) and "seq" in record and "event" in record:
+                        records.append(record)
+        except FileNotFoundError:
+            pass
+        return records
+
+    def _truncate_journal(self):
+        """Empty the journal once its records are in the snapshot (executor)."""
+        try:
+            with open(self._journal_path, "w", encoding="utf-8"):
+                pass
+        except FileNotFoundError:
+            pass
+
+    def get_all_events(self) -> list[BabyEvent]:
+        """Get the raw events plus the growth events kept past retention, in time order."""
+        return list(heapq.merge(self._compacted_growth, self.events, key=attrgetter("start")))
+
     def get_events(self, start_date: datetime, end_date: datetime) -> list[BabyEvent]:
-        """Get events within a date range."""
+        """Get events within a date range.
+
+        Only events starting in [start_date - longest span, end_date] can overlap the
+        range, so the scan is limited to that slice of the start-sorted list.
+        """
+        lo = bisect_left(self._starts, start_date - self._max_span)
+        hi = bisect_right(self._starts, end_date)
         results = []
-        for event in self.events:
+        for event in self.events[lo:hi]:
             if event.end and event.start < end_date and event.end > start_date:
                 results.append(event)
             elif not event.end and event.start >= start_date and event.start <= end_date:
                 results.append(event)
         return results
 
-    def get_stats_last_24h(self):
-        """Calculate statistics for the last 24 hours."""
-        now = datetime.now()
-        start_monitor = now - timedelta(hours=24)
-        
-        events_24h = [
-            e for e in self.events
-            if e.start >= start_monitor
+    def has_event(self, event: BabyEvent) -> bool:
+        """Return True if an event of the same type and start is stored."""
+        idx = bisect_left(self._starts, event.start)
+        while idx < len(self.events) and self._starts[idx] == event.start:
+            if self.events[idx].type == event.type:
+                return True
+            idx += 1
+        return False
+
+    def is_compacted(self, event: BabyEvent) -> bool:
+        """Return True if the event's day was folded into a summary (its raw events are gone)."""
+        return event.start.date() in self._compacted_days
+
+    def get_daily_summaries(self, start_date: datetime, end_date: datetime) -> list[DailySummary]:
+        """Get the rollups of compacted days (no raw events left) overlapping a date range."""
+        return [
+            self.daily_rollup[day] for day in sorted(self._compacted_days)
+            if start_date.date() <= day <= end_date.date()
         ]
-        
-        poo_count = sum(1 for e in events_24h if e.type == "poo" or (e.type == "diaper" and "Cacca" in e.summary))
-        pee_count = sum(1 for e in events_24h if e.type == "pee" or (e.type == "diaper" and "Pipì" in e.summary))
-        feeding_count = sum(1 for e in events_24h if e.type == "feeding" or "Poppata" in e.summary)
-        
-        # Fallback for old "summary-based" logic if type isn't migrated
-        if poo_count == 0 and pee_count == 0 and feeding_count == 0:
-             poo_count = sum(1 for e in events_24h if "Cacca" in e.summary or "Misto" in e.summary)
-             pee_count = sum(1 for e in events_24h if "Pipì" in e.summary or "Misto" in e.summary)
-             feeding_count = sum(1 for e in events_24h if "Poppata" in e.summary)
-
-        return {
-            "poo": poo_count,
-            "pee": pee_count,
-            "feeding": feeding_count
-        }
+
+    def get_daily_stats(self, start_day: date, end_day: date) -> list[DailySummary]:
+        """Get the (read-only) rollups of the tracked days in a range, in O(days)."""
+        stats = []
+        for offset in range((end_day - start_day).days + 1):
+            if summary := self.daily_rollup.get(start_day + timedelta(days=offset)):
+                stats.append(summary)
+        return stats
+
+    def get_next_24h_expiry(self) -> datetime | None:
+        """Get when the oldest event of the last 24h leaves the window."""
+        return self._last_24h.next_expiry()
+
+    def get_stats_last_24h(self):
+        """Return statistics for the last 24 hours from the rolling window."""
+        return self._last_24h.counts()
+
+    def get_growth_series(
+        self, metric: str, start_date: datetime | None = None, end_date: datetime | None = None
+    ) -> list[tuple[datetime, float]]:
+        """Get the (time, value) measurements of a growth metric, optionally in a range."""
+        series = self._growth.get(metric, [])
+        lo = bisect_left(series, start_date, key=itemgetter(0)) if start_date else 0
+        hi = bisect_right(series, end_date, key=itemgetter(0)) if end_date else len(series)
+        return series[lo:hi]
+
+    def get_last_breast_side(self) -> str | None:
+        """Get the side (sx or dx) of the most recent single-side breastfeeding."""
+        event = self._last_by_category.get(LAST_BREAST_KEY)
+        return event.side if event else None
 
     def get_last_events(self):
-        """Get the most recent event of each type."""
-        last_feeding = None
-        last_poo = None
-        last_pee = None
-        
-        # Iterate backwards
-        for event in reversed(self.events):
-            # Prefer 'type' but fallback to string matching for old data compatibility
-            is_feeding = event.type == "feeding" or "Poppata" in event.summary
-            is_poo = event.type == "poo" or "Cacca" in event.summary or "Misto" in event.summary
-            is_pee = event.type == "pee" or "Pipì" in event.summary or "Misto" in event.summary
-
-            if not last_feeding and is_feeding:
-                last_feeding = event
-            if not last_poo and is_poo:
-                last_poo = event
-            if not last_pee and is_pee:
-                last_pee = event
-                
-            if last_feeding and last_poo and last_pee:
-                break
-                
-        return {
-            "feeding": last_feeding,
-            "poo": last_poo,
-            "pee": last_pee
-        }
+        """Get the most recent event of each category."""
+        return {category: self._last_by_category.get(category) for category in CATEGORIES}
@@ -0,0 +1,241 @@
+"""WHO growth percentiles for Baby Tracker.
+
+Z-scores follow the LMS method of the WHO Child Growth Standards (2006):
+z = ((value / M) ** L - 1) / (L * S), with L, M and S interpolated linearly
+between the monthly reference values (birth to 5 years). The tables are
+unpacked once, at import, into flat per-column arrays indexed by month, so a
+lookup is two array reads and a whole series is scored in one pass.
+"""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from datetime import date, datetime
+from math import log
+from statistics import NormalDist
+
+SEXES = ("male", "female")
+
+# Average month length used by the WHO standards (days)
+DAYS_PER_MONTH = 30.4375
+
+# Monthly (L, M, S) from birth to 60 months, WHO Child Growth Standards:
+# weight-for-age (kg), length/height-for-age (cm), head circumference-for-age (cm).
+# Children are measured lying down (length) up to 24 months and standing (height)
+# from 24 months, so the "height" rows stop at 24 months and continue below.
+_LMS = {
+    ("weight", "male"): (
+        (0.3487, 3.3464, 0.14602), (0.2297, 4.4709, 0.13395), (0.1970, 5.5675, 0.12385),
+        (0.1738, 6.3762, 0.11727), (0.1553, 7.0023, 0.11316), (0.1395, 7.5105, 0.11080),
+        (0.1257, 7.9340, 0.10958), (0.1134, 8.2970, 0.10902), (0.1021, 8.6151, 0.10882),
+        (0.0917, 8.9014, 0.10881), (0.0820, 9.1649, 0.10891), (0.0730, 9.4122, 0.10906),
+        (0.0644, 9.6479, 0.10925), (0.0563, 9.8749, 0.10949), (0.0487, 10.0953, 0.10976),
+        (0.0413, 10.3108, 0.11007), (0.0343, 10.5228, 0.11041), (0.0275, 10.7319, 0.11079),
+        (0.0211, 10.9385, 0.11119), (0.0148, 11.1430, 0.11164), (0.0087, 11.3462, 0.11211),
+        (0.0029, 11.5486, 0.11261), (-0.0028, 11.7504, 0.11314), (-0.0083, 11.9514, 0.11369),
+        (-0.0137, 12.1515, 0.11426), (-0.0189, 12.3502, 0.11485), (-0.0240, 12.5466, 0.11544),
+        (-0.0289, 12.7401, 0.11604), (-0.0337, 12.9303, 0.11664), (-0.0385, 13.1169, 0.11723),
+        (-0.0431, 13.3000, 0.11781), (-0.0476, 13.4798, 0.11839), (-0.0520, 13.6567, 0.11896),
+        (-0.0564, 13.8309, 0.11953), (-0.0606, 14.0031, 0.12008), (-0.0648, 14.1736, 0.12062),
+        (-0.0689, 14.3429, 0.12116), (-0.0729, 14.5113, 0.12168), (-0.0769, 14.6791, 0.12220),
+        (-0.0808, 14.8466, 0.12271), (-0.0846, 15.0140, 0.12322), (-0.0883, 15.1813, 0.12373),
+        (-0.0920, 15.3486, 0.12425), (-0.0957, 15.5158, 0.12478), (-0.0993, 15.6828, 0.12531),
+        (-0.1028, 15.8497, 0.12586), (-0.1063, 16.0163, 0.12643), (-0.1097, 16.1827, 0.12700),
+        (-0.1131, 16.3489, 0.12759), (-0.1165, 16.5150, 0.12819), (-0.1198, 16.6811, 0.12880),
+        (-0.1230, 16.8471, 0.12943), (-0.1262, 17.0132, 0.13005), (-0.1294, 17.1792, 0.13069),
+        (-0.1325, 17.3452, 0.13133), (-0.1356, 17.5111, 0.13197), (-0.1387, 17.6768, 0.13261),
+        (-0.1417, 17.8422, 0.13325), (-0.1447, 18.0073, 0.13389), (-0.1477, 18.1722, 0.13453),
+        (-0.1506, 18.3366, 0.13517),
+    ),
+    ("weight", "female"): (
+        (0.3809, 3.2322, 0.14171), (0.1714, 4.1873, 0.13724), (0.0962, 5.1282, 0.13000),
+        (0.0402, 5.8458, 0.12619), (-0.0050, 6.4237, 0.12402), (-0.0430, 6.8985, 0.12274),
+        (-0.0756, 7.2970, 0.12204), (-0.1039, 7.6422, 0.12178), (-0.1288, 7.9487, 0.12181),
+        (-0.1507, 8.2254, 0.12199), (-0.1700, 8.4800, 0.12223), (-0.1872, 8.7192, 0.12247),
+        (-0.2024, 8.9481, 0.12268), (-0.2158, 9.1699, 0.12283), (-0.2278, 9.3870, 0.12294),
+        (-0.2384, 9.6008, 0.12299), (-0.2478, 9.8124, 0.12303), (-0.2562, 10.0226, 0.12306),
+        (-0.2637, 10.2315, 0.12309), (-0.2703, 10.4393, 0.12315), (-0.2762, 10.6464, 0.12323),
+        (-0.2815, 10.8534, 0.12335), (-0.2862, 11.0608, 0.12350), (-0.2903, 11.2688, 0.12369),
+        (-0.2941, 11.4775, 0.12390), (-0.2975, 11.6864, 0.12414), (-0.3005, 11.8947, 0.12441),
+        (-0.3032, 12.1015, 0.12472), (-0.3057, 12.3059, 0.12506), (-0.3080, 12.5073, 0.12545),
+        (-0.3101, 12.7055, 0.12587), (-0.3120, 12.9006, 0.12633), (-0.3138, 13.0930, 0.12683),
+        (-0.3155, 13.2837, 0.12737), (-0.3171, 13.4731, 0.12794), (-0.3186, 13.6618, 0.12855),
+        (-0.3201, 13.8503, 0.12919), (-0.3216, 14.0385, 0.12988), (-0.3230, 14.2265, 0.13059),
+        (-0.3243, 14.4140, 0.13135), (-0.3257, 14.6010, 0.13213), (-0.3270, 14.7873, 0.13293),
+        (-0.3283, 14.9727, 0.13376), (-0.3296, 15.1573, 0.13460), (-0.3309, 15.3410, 0.13545),
+        (-0.3322, 15.5240, 0.13630), (-0.3335, 15.7064, 0.13716), (-0.3348, 15.8882, 0.13800),
+        (-0.3361, 16.0697, 0.13884), (-0.3374, 16.2511, 0.13968), (-0.3387, 16.4322, 0.14051),
+        (-0.3400, 16.6133, 0.14132), (-0.3414, 16.7942, 0.14213), (-0.3427, 16.9748, 0.14293),
+        (-0.3440, 17.1551, 0.14371), (-0.3453, 17.3347, 0.14448), (-0.3466, 17.5136, 0.14525),
+        (-0.3479, 17.6916, 0.14600), (-0.3492, 17.8686, 0.14675), (-0.3505, 18.0445, 0.14748),
+        (-0.3518, 18.2193, 0.14821),
+    ),
+    ("height", "male"): (
+        (1, 49.8842, 0.03795), (1, 54.7244, 0.03557), (1, 58.4249, 0.03424),
+        (1, 61.4292, 0.03328), (1, 63.8860, 0.03257), (1, 65.9026, 0.03204),
+        (1, 67.6236, 0.03165), (1, 69.1645, 0.03139), (1, 70.5994, 0.03124),
+        (1, 71.9687, 0.03117), (1, 73.2812, 0.03118), (1, 74.5388, 0.03125),
+        (1, 75.7488, 0.03137), (1, 76.9186, 0.03154), (1, 78.0497, 0.03174),
+        (1, 79.1458, 0.03197), (1, 80.2113, 0.03222), (1, 81.2487, 0.03250),
+        (1, 82.2587, 0.03279), (1, 83.2418, 0.03310), (1, 84.1996, 0.03342),
+        (1, 85.1348, 0.03376), (1, 86.0477, 0.03410), (1, 86.9410, 0.03445),
+        (1, 87.8161, 0.03479),
+    ),
+    ("height", "female"): (
+        (1, 49.1477, 0.03790), (1, 53.6872, 0.03640), (1, 57.0673, 0.03568),
+        (1, 59.8029, 0.03520), (1, 62.0899, 0.03486), (1, 64.0301, 0.03463),
+        (1, 65.7311, 0.03448), (1, 67.2873, 0.03441), (1, 68.7498, 0.03440),
+        (1, 70.1435, 0.03444), (1, 71.4818, 0.03452), (1, 72.7710, 0.03464),
+        (1, 74.0150, 0.03479), (1, 75.2176, 0.03496), (1, 76.3817, 0.03514),
+        (1, 77.5099, 0.03534), (1, 78.6055, 0.03555), (1, 79.6710, 0.03576),
+        (1, 80.7079, 0.03598), (1, 81.7182, 0.03620), (1, 82.7036, 0.03643),
+        (1, 83.6654, 0.03666), (1, 84.6040, 0.03688), (1, 85.5202, 0.03711),
+        (1, 86.4153, 0.03734),
+    ),
+    ("head", "male"): (
+        (1, 34.4618, 0.03686), (1, 37.2759, 0.03133), (1, 39.1285, 0.02997),
+        (1, 40.5135, 0.02918), (1, 41.6317, 0.02868), (1, 42.5576, 0.02837),
+        (1, 43.3306, 0.02817), (1, 43.9803, 0.02804), (1, 44.5300, 0.02796),
+        (1, 44.9998, 0.02792), (1, 45.4051, 0.02790), (1, 45.7573, 0.02789),
+        (1, 46.0661, 0.02789), (1, 46.3395, 0.02789), (1, 46.5844, 0.02791),
+        (1, 46.8060, 0.02792), (1, 47.0088, 0.02795), (1, 47.1962, 0.02797),
+        (1, 47.3711, 0.02800), (1, 47.5357, 0.02803), (1, 47.6919, 0.02806),
+        (1, 47.8408, 0.02810), (1, 47.9833, 0.02813), (1, 48.1201, 0.02817),
+        (1, 48.2515, 0.02821), (1, 48.3777, 0.02825), (1, 48.4989, 0.02830),
+        (1, 48.6151, 0.02834), (1, 48.7264, 0.02838), (1, 48.8331, 0.02842),
+        (1, 48.9351, 0.02847), (1, 49.0327, 0.02851), (1, 49.1260, 0.02855),
+        (1, 49.2153, 0.02859), (1, 49.3007, 0.02863), (1, 49.3826, 0.02867),
+        (1, 49.4612, 0.02871), (1, 49.5367, 0.02875), (1, 49.6093, 0.02878),
+        (1, 49.6791, 0.02882), (1, 49.7465, 0.02886), (1, 49.8116, 0.02889),
+        (1, 49.8745, 0.02893), (1, 49.9354, 0.02896), (1, 49.9942, 0.02899),
+        (1, 50.0512, 0.02903), (1, 50.1064, 0.02906), (1, 50.1598, 0.02909),
+        (1, 50.2115, 0.02912), (1, 50.2617, 0.02915), (1, 50.3105, 0.02918),
+        (1, 50.3578, 0.02921), (1, 50.4039, 0.02924), (1, 50.4488, 0.02927),
+        (1, 50.4926, 0.02929), (1, 50.5354, 0.02932), (1, 50.5772, 0.02935),
+        (1, 50.6183, 0.02938), (1, 50.6587, 0.02940), (1, 50.6984, 0.02943),
+        (1, 50.7375, 0.02946),
+    ),
+    ("head", "female"): (
+        (1, 33.8787, 0.03496), (1, 36.5463, 0.03210), (1, 38.2521, 0.03168),
+        (1, 39.5328, 0.03140), (1, 40.5817, 0.03119), (1, 41.4590, 0.03102),
+        (1, 42.1995, 0.03087), (1, 42.8290, 0.03075), (1, 43.3671, 0.03063),
+        (1, 43.8300, 0.03053), (1, 44.2319, 0.03044), (1, 44.5844, 0.03035),
+        (1, 44.8965, 0.03027), (1, 45.1752, 0.03019), (1, 45.4265, 0.03012),
+        (1, 45.6551, 0.03006), (1, 45.8650, 0.02999), (1, 46.0598, 0.02993),
+        (1, 46.2424, 0.02987), (1, 46.4152, 0.02982), (1, 46.5801, 0.02977),
+        (1, 46.7384, 0.02972), (1, 46.8913, 0.02967), (1, 47.0391, 0.02962),
+        (1, 47.1822, 0.02957), (1, 47.3204, 0.02953), (1, 47.4536, 0.02949),
+        (1, 47.5817, 0.02945), (1, 47.7045, 0.02941), (1, 47.8219, 0.02937),
+        (1, 47.9340, 0.02933), (1, 48.0410, 0.02929), (1, 48.1432, 0.02926),
+        (1, 48.2408, 0.02922), (1, 48.3343, 0.02919), (1, 48.4239, 0.02915),
+        (1, 48.5099, 0.02912), (1, 48.5926, 0.02909), (1, 48.6722, 0.02906),
+        (1, 48.7489, 0.02903), (1, 48.8228, 0.02900), (1, 48.8941, 0.02897),
+        (1, 48.9629, 0.02894), (1, 49.0294, 0.02891), (1, 49.0937, 0.02888),
+        (1, 49.1560, 0.02886), (1, 49.2164, 0.02883), (1, 49.2751, 0.02880),
+        (1, 49.3321, 0.02878), (1, 49.3877, 0.02875), (1, 49.4419, 0.02873),
+        (1, 49.4947, 0.02870), (1, 49.5464, 0.02868), (1, 49.5969, 0.02865),
+        (1, 49.6464, 0.02863), (1, 49.6947, 0.02861), (1, 49.7421, 0.02859),
+        (1, 49.7885, 0.02856), (1, 49.8341, 0.02854), (1, 49.8789, 0.02852),
+        (1, 49.9229, 0.02850),
+    ),
+}
+
+_STANDING_HEIGHT_LMS = {
+    "male": (
+        (1, 87.1161, 0.03507), (1, 87.9720, 0.03542), (1, 88.8065, 0.03576),
+        (1, 89.6197, 0.03610), (1, 90.4120, 0.03642), (1, 91.1828, 0.03674),
+        (1, 91.9327, 0.03704), (1, 92.6631, 0.03733), (1, 93.3753, 0.03761),
+        (1, 94.0711, 0.03787), (1, 94.7532, 0.03812), (1, 95.4236, 0.03836),
+        (1, 96.0835, 0.03858), (1, 96.7337, 0.03879), (1, 97.3749, 0.03900),
+        (1, 98.0073, 0.03919), (1, 98.6310, 0.03937), (1, 99.2459, 0.03954),
+        (1, 99.8515, 0.03971), (1, 100.4485, 0.03986), (1, 101.0374, 0.04002),
+        (1, 101.6186, 0.04016), (1, 102.1933, 0.04031), (1, 102.7625, 0.04045),
+        (1, 103.3273, 0.04059), (1, 103.8886, 0.04073), (1, 104.4473, 0.04086),
+        (1, 105.0041, 0.04100), (1, 105.5596, 0.04113), (1, 106.1138, 0.04126),
+        (1, 106.6668, 0.04139), (1, 107.2188, 0.04152), (1, 107.7697, 0.04165),
+        (1, 108.3198, 0.04177), (1, 108.8689, 0.04190), (1, 109.4170, 0.04202),
+        (1, 109.9638, 0.04214),
+    ),
+    "female": (
+        (1, 85.7153, 0.03764), (1, 86.5904, 0.03786), (1, 87.4462, 0.03808),
+        (1, 88.2830, 0.03830), (1, 89.1004, 0.03851), (1, 89.8991, 0.03872),
+        (1, 90.6797, 0.03893), (1, 91.4430, 0.03913), (1, 92.1906, 0.03933),
+        (1, 92.9239, 0.03952), (1, 93.6444, 0.03971), (1, 94.3533, 0.03989),
+        (1, 95.0515, 0.04006), (1, 95.7399, 0.04024), (1, 96.4187, 0.04041),
+        (1, 97.0885, 0.04057), (1, 97.7493, 0.04073), (1, 98.4015, 0.04089),
+        (1, 99.0448, 0.04105), (1, 99.6795, 0.04120), (1, 100.3058, 0.04135),
+        (1, 100.9238, 0.04150), (1, 101.5337, 0.04164), (1, 102.1360, 0.04179),
+        (1, 102.7312, 0.04193), (1, 103.3197, 0.04206), (1, 103.9021, 0.04220),
+        (1, 104.4786, 0.04233), (1, 105.0494, 0.04246), (1, 105.6148, 0.04259),
+        (1, 106.1748, 0.04272), (1, 106.7295, 0.04285), (1, 107.2788, 0.04298),
+        (1, 107.8227, 0.04310), (1, 108.3613, 0.04322), (1, 108.8948, 0.04334),
+        (1, 109.4233, 0.04347),
+    ),
+}
+
+
+def _columns(rows: tuple) -> tuple[array, array, array]:
+    return tuple(array("d", column) for column in zip(*rows))
+
+
+# (metric, sex) -> segments of (first month, L, M, S columns), in month order
+TABLES: dict[tuple[str, str], tuple[tuple[int, array, array, array], ...]] = {
+    key: ((0, *_columns(rows)),) for key, rows in _LMS.items()
+}
+for _sex, _rows in _STANDING_HEIGHT_LMS.items():
+    TABLES[("height", _sex)] += ((24, *_columns(_rows)),)
+
+_NORMAL = NormalDist()
+
+
+def age_in_months(birth_date: date, at: datetime | date) -> float:
+    """Return the age in (fractional) months at a given time."""
+    if isinstance(at, datetime):
+        at = at.date()
+    return (at - birth_date).days / DAYS_PER_MONTH
+
+
+def z_scores(metric: str, sex: str, ages: Sequence[float], values: Sequence[float]) -> list[float | None]:
+    """Z-scores of measurements at the given ages (months); None outside the tables."""
+    if (segments := TABLES.get((metric, sex))) is None:
+        return [None] * len(values)
+    scores = []
+    for age, value in zip(ages, values):
+        # Segments are few (at most two): the last one starting at or before age
+        for first, col_l, col_m, col_s in reversed(segments):
+            if age >= first:
+                break
+        age -= first
+        last = len(col_m) - 1
+        if not 0 <= age <= last or value <= 0:
+            scores.append(None)
+            continue
+        month = min(int(age), last - 1)
+        frac = age - month
+        l = col_l[month] + (col_l[month + 1] - col_l[month]) * frac
+        m = col_m[month] + (col_m[month + 1] - col_m[month]) * frac
+        s = col_s[month] + (col_s[month + 1] - col_s[month]) * frac
+        if l:
+            scores.append(((value / m) ** l - 1) / (l * s))
+        else:
+            scores.append(log(value / m) / s)
+    return scores
+
+
+def z_score(metric: str, sex: str, age: float, value: float) -> float | None:
+    """Z-score of a single measurement at an age in months."""
+    return z_scores(metric, sex, (age,), (value,))[0]
+
+
+def percentile(z: float | None) -> float | None:
+    """Convert a z-score to a percentile (0-100)."""
+    return _NORMAL.cdf(z) * 100 if z is not None else None
+
+
+def series_percentiles(
+    metric: str, sex: str, birth_date: date, series: Sequence[tuple[datetime, float]]
+) -> list[tuple[float | None, float | None]]:
+    """(z-score, percentile) of every point of a growth series."""
+    ages = [age_in_months(birth_date, at) for at, _value in series]
+    scores = z_scores(metric, sex, ages, [value for _at, value in series])
+    return [(z, percentile(z)) for z in scores]
@@ -0,0 +1,222 @@
+"""Streaming export and import of the Baby Tracker event history.
+
+Files are written and read in chunks of CHUNK_SIZE records in executor jobs, so
+memory stays flat whatever the history size. Supported formats are CSV and
+NDJSON (one JSON event per line, the same dicts as the store).
+"""
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .const import ATTR_ENTRY_ID, DOMAIN
+from .event_store import EventStore, backfill_feeding, legacy_categories, to_local_naive
+from .models import BabyEvent
+
+_LOGGER = logging.getLogger(__name__)
+
+CHUNK_SIZE = 500
+FORMATS = ("csv", "ndjson")
+CSV_FIELDS = [
+    "type", "start", "end", "summary", "description", "categories", "data",
+    "side", "duration_s", "volume_ml", "metric", "value",
+]
+EVENT_PROGRESS = f"{DOMAIN}_transfer_progress"
+
+SERVICE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_ENTRY_ID): cv.string,
+    vol.Required("path"): cv.string,
+    vol.Optional("format"): vol.In(FORMATS),
+})
+
+
+def _detect_format(path: str, fmt: str | None) -> str:
+    """Use the given format or guess it from the file extension."""
+    if fmt:
+        return fmt
+    return "csv" if path.lower().endswith(".csv") else "ndjson"
+
+
+def _check_path(hass: HomeAssistant, path: str):
+    """Only touch files inside allowlist_external_dirs."""
+    if not hass.config.is_allowed_path(path):
+        raise HomeAssistantError(f"Path not allowed: {path} (add it to allowlist_external_dirs)")
+
+
+def _report(hass: HomeAssistant, operation: str, path: str, done: int, total: int):
+    """Log and fire a progress event."""
+    _LOGGER.info("Baby Tracker %s %s: %s/%s", operation, path, done, total)
+    hass.bus.async_fire(EVENT_PROGRESS, {"operation": operation, "path": path, "done": done, "total": total})
+
+
+class _ChunkWriter:
+    """Append-only writer used from executor jobs."""
+
+    def __init__(self, path: str, fmt: str):
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._fmt = fmt
+        if fmt == "csv":
+            self._csv = csv.DictWriter(self._file, fieldnames=CSV_FIELDS)
+            self._csv.writeheader()
+
+    def write(self, records: list[dict]):
+        if self._fmt == "csv":
+            self._csv.writerows({
+                **record,
+                "end": record["end"] or "",
+                "side": record["side"] or "",
+                "categories": ";".join(record["categories"]),
+                "data": json.dumps(record["data"], ensure_ascii=False) if record["data"] else "",
+            } for record in records)
+        else:
+            self._file.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+
+    def close(self):
+        self._file.close()
+
+
+class _ChunkReader:
+    """Reads up to CHUNK_SIZE records per call, used from executor jobs."""
+
+    def __init__(self, path: str, fmt: str):
+        self.size = os.path.getsize(path)
+        self._file = open(path, encoding="utf-8", newline="")
+        self._fmt = fmt
+        self._rows = csv.DictReader(self._file) if fmt == "csv" else self._file
+        self.line = 1 if fmt == "csv" else 0
+
+    @property
+    def position(self) -> int:
+        """Approximate bytes consumed so far (includes read-ahead)."""
+        return min(self._file.buffer.tell(), self.size)
+
+    def read(self) -> list[tuple[int, dict | None]]:
+        """Return (line number, record or None if unparsable) pairs; empty at EOF."""
+        chunk = []
+        for row in self._rows:
+            self.line += 1
+            if self._fmt == "csv":
+                chunk.append((self.line, self._from_csv(row)))
+            elif row.strip():
+                try:
+                    chunk.append((self.line, json.loads(row)))
+                except ValueError:
+                    chunk.append((self.line, None))
+            if len(chunk) >= CHUNK_SIZE:
+                break
+        return chunk
+
+    @staticmethod
+    def _from_csv(row: dict) -> dict | None:
+        try:
+            record = dict(row)
+            record["end"] = record.get("end") or None
+            record["categories"] = [c for c in (record.get("categories") or "").split(";") if c]
+            record["data"] = json.loads(record["data"]) if record.get("data") else {}
+            for key in ("side", "duration_s", "volume_ml", "metric", "value"):
+                if not record.get(key):
+                    record.pop(key, None)
+            if not record["categories"]:
+                del record["categories"]
+            return record
+        except (TypeError, ValueError):
+            return None
+
+    def close(self):
+        self._file.close()
+
+
+async def async_export(hass: HomeAssistant, store: EventStore, path: str, fmt: str | None = None) -> int:
+    """Write the whole history to path, chunk by chunk. Returns the event count."""
+    _check_path(hass, path)
+    fmt = _detect_format(path, fmt)
+    await store.async_ensure_history()
+    # A list of references: events are serialized one chunk at a time. Growth
+    # measurements outlive retention, so they are exported with the raw events
+    events = store.get_all_events()
+    total = len(events)
+
+    writer = await hass.async_add_executor_job(_ChunkWriter, path, fmt)
+    try:
+        for offset in range(0, total, CHUNK_SIZE):
+            records = [event.to_dict() for event in events[offset:offset + CHUNK_SIZE]]
+            await hass.async_add_executor_job(writer.write, records)
+            if (offset // CHUNK_SIZE) % 20 == 19:
+                _report(hass, "export", path, offset + len(records), total)
+    finally:
+        await hass.async_add_executor_job(writer.close)
+
+    _report(hass, "export", path, total, total)
+    return total
+
+
+async def async_import(hass: HomeAssistant, coordinator, path: str, fmt: str | None = None) -> dict:
+    """Validate and append the events in path, one journal write and update per chunk.
+
+    Events already in the store or earlier in the file (same type and start) are
+    skipped, so re-running an import is harmless. Events on days already folded
+    into daily summaries are skipped too: their raw events are gone, and adding
+    them again would count the day twice. The snapshot is rewritten once, at the
+    end. Returns imported/duplicate/compacted/invalid counts.
+    """
+    _check_path(hass, path)
+    fmt = _detect_format(path, fmt)
+    store: EventStore = coordinator.store
+    await store.async_ensure_history()
+
+    try:
+        reader = await hass.async_add_executor_job(_ChunkReader, path, fmt)
+    except OSError as err:
+        raise HomeAssistantError(f"Cannot read {path}: {err}") from err
+
+    result = {"imported": 0, "duplicates": 0, "compacted": 0, "invalid": 0}
+    chunks = 0
+    try:
+        while chunk := await hass.async_add_executor_job(reader.read):
+            batch = []
+            batch_keys = set()
+            for line, record in chunk:
+                if isinstance(record, dict) and "categories" not in record:
+                    record["categories"] = legacy_categories(record)
+                if isinstance(record, dict) and "duration_s" not in record:
+                    backfill_feeding(record)
+                event = BabyEvent.from_dict(record) if isinstance(record, dict) else None
+                if event is None:
+                    result["invalid"] += 1
+                    _LOGGER.warning("Skipping invalid record at %s:%s", path, line)
+                    continue
+                # The store keeps naive local times
+                event.start = to_local_naive(event.start)
+                if event.end:
+                    event.end = to_local_naive(event.end)
+                key = (event.type, event.start)
+                if key in batch_keys or store.has_event(event):
+                    result["duplicates"] += 1
+                elif store.is_compacted(event):
+                    result["compacted"] += 1
+                else:
+                    batch_keys.add(key)
+                    batch.append(event)
+            if batch:
+                await coordinator.async_add_events(batch)
+                # Journal only: a snapshot rewrite per chunk would make imports quadratic
+                await store.async_flush(compact=False)
+                result["imported"] += len(batch)
+            chunks += 1
+            if chunks % 20 == 0:
+                _report(hass, "import", path, reader.position, reader.size)
+    finally:
+        await hass.async_add_executor_job(reader.close)
+        if result["imported"]:
+            await store.async_save()
+
+    _report(hass, "import", path, reader.size, reader.size)
+    return result
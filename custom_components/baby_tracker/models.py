@@ -1,33 +1,80 @@
 """Data models for Baby Tracker."""
 from __future__ import annotations
 
+import sys
+from bisect import insort
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from typing import Literal
 
-@dataclass
+# Canonical categories implied by each event type ("diaper" is a mixed change)
+TYPE_CATEGORIES = {
+    "feeding": ("feeding",),
+    "poo": ("poo",),
+    "pee": ("pee",),
+    "diaper": ("poo", "pee"),
+    "growth": ("growth",),
+    "sleep": ("sleep",),
+}
+
+# Shared category tuples, so loaded events reference one tuple per combination
+_CATEGORY_TUPLES: dict[tuple[str, ...], tuple[str, ...]] = {
+    categories: categories for categories in TYPE_CATEGORIES.values()
+}
+
+# Sides of a feeding
+FEEDING_SIDES = ("sx", "dx", "both", "bottle")
+
+# Growth metrics and their units
+GROWTH_METRICS = {"weight": "kg", "height": "cm", "head": "cm"}
+
+@dataclass(slots=True)
 class BabyEvent:
-    """Representation of a single event."""
-    type: Literal["feeding", "poo", "pee", "growth", "diaper"]
+    """Representation of a single event.
+
+    Slotted, with interned strings: histories repeat the same few types, summaries
+    and descriptions thousands of times.
+    """
+    type: Literal["feeding", "poo", "pee", "growth", "diaper", "sleep"]
     start: datetime
     end: datetime | None = None
     summary: str = ""
     description: str = ""
-    data: dict = field(default_factory=dict)  # Extra data like side, weight, etc.
+    data: dict = field(default_factory=dict)  # Extra data like weight, etc.
+    categories: tuple[str, ...] = ()  # Precomputed, see TYPE_CATEGORIES
+    # Feeding fields
+    side: str | None = None  # One of FEEDING_SIDES
+    duration_s: int | None = None
+    volume_ml: int | None = None
+    # Growth fields
+    metric: str | None = None  # One of GROWTH_METRICS
+    value: float | None = None
+
+    def __post_init__(self):
+        """Derive categories from the type when not given."""
+        if not self.categories:
+            self.categories = TYPE_CATEGORIES.get(self.type, ())
 
     @classmethod
     def from_dict(cls, data: dict) -> BabyEvent | None:
         """Create object from dict with validation."""
         try:
+            categories = tuple(data.get("categories", ()))
             return cls(
-                type=data["type"],
+                type=sys.intern(data["type"]),
                 start=datetime.fromisoformat(data["start"]),
                 end=datetime.fromisoformat(data["end"]) if data.get("end") else None,
-                summary=data.get("summary", ""),
-                description=data.get("description", ""),
-                data=data.get("data", {})
+                summary=sys.intern(data.get("summary", "")),
+                description=sys.intern(data.get("description", "")),
+                data=data.get("data", {}),
+                categories=_CATEGORY_TUPLES.setdefault(categories, categories),
+                side=sys.intern(data["side"]) if data.get("side") else None,
+                duration_s=int(data["duration_s"]) if data.get("duration_s") is not None else None,
+                volume_ml=int(data["volume_ml"]) if data.get("volume_ml") is not None else None,
+                metric=sys.intern(data["metric"]) if data.get("metric") else None,
+                value=float(data["value"]) if data.get("value") is not None else None
             )
-        except (KeyError, ValueError):
+        except (KeyError, TypeError, ValueError):
             return None
 
     def to_dict(self) -> dict:
@@ -38,5 +85,138 @@ class BabyEvent:
             "end": self.end.isoformat() if self.end else None,
             "summary": self.summary,
             "description": self.description,
-            "data": self.data
+            "data": self.data,
+            "categories": list(self.categories),
+            "side": self.side,
+            "duration_s": self.duration_s,
+            "volume_ml": self.volume_ml,
+            "metric": self.metric,
+            "value": self.value
+        }
+
+    @property
+    def duration_minutes(self) -> int:
+        """Return the feeding duration in whole minutes."""
+        if self.duration_s is not None:
+            return self.duration_s // 60
+        if self.end:
+            return int((self.end - self.start).total_seconds() / 60)
+        return 0
+
+
+@dataclass
+class DailySummary:
+    """Per-day rollup of events, kept for every day and persisted for compacted ones."""
+    day: date
+    counts: dict[str, int] = field(default_factory=dict)
+    feeding_minutes: int = 0
+    sides: dict[str, int] = field(default_factory=dict)
+    longest_gap_minutes: int = 0  # Longest time between two feedings of the day
+    # Feeding starts of the day, in memory only (not persisted)
+    feeding_starts: list[datetime] = field(default_factory=list, repr=False, compare=False)
+
+    @property
+    def mean_feeding_minutes(self) -> float:
+        """Return the mean feeding duration of the day."""
+        feedings = self.counts.get("feeding", 0)
+        return self.feeding_minutes / feedings if feedings else 0.0
+
+    def add(self, event: BabyEvent):
+        """Account for one event of this day."""
+        for category in event.categories:
+            self.counts[category] = self.counts.get(category, 0) + 1
+        if "feeding" not in event.categories:
+            return
+        self.feeding_minutes += event.duration_minutes
+        if event.side:
+            self.sides[event.side] = self.sides.get(event.side, 0) + 1
+
+        insort(self.feeding_starts, event.start)
+        gaps = [
+            int((later - earlier).total_seconds() / 60)
+            for earlier, later in zip(self.feeding_starts, self.feeding_starts[1:])
+        ]
+        if len(self.feeding_starts) == self.counts["feeding"]:
+            # Every feeding of the day is known: a back-dated one can shorten the gap
+            self.longest_gap_minutes = max(gaps, default=0)
+        else:
+            # Restored summary of a compacted day: only widen
+            self.longest_gap_minutes = max([self.longest_gap_minutes] + gaps)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> DailySummary | None:
+        """Create object from dict with validation."""
+        try:
+            return cls(
+                day=date.fromisoformat(data["day"]),
+                counts=dict(data.get("counts", {})),
+                feeding_minutes=data.get("feeding_minutes", 0),
+                sides=dict(data.get("sides", {})),
+                longest_gap_minutes=data.get("longest_gap_minutes", 0)
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def to_dict(self) -> dict:
+        """Serialize to dict."""
+        return {
+            "day": self.day.isoformat(),
+            "counts": self.counts,
+            "feeding_minutes": self.feeding_minutes,
+            "sides": self.sides,
+            "longest_gap_minutes": self.longest_gap_minutes
         }
+
+
+@dataclass
+class FeedingSession:
+    """A live feeding timer, persisted on its own so it survives restarts.
+
+    A stopped session stays persisted until its event is written, so the side
+    can still be chosen after a restart.
+    """
+    start: datetime
+    started_by: str | None = None
+    side_switches: list[tuple[datetime, str]] = field(default_factory=list)
+    stopped_at: datetime | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> FeedingSession | None:
+        """Create object from dict with validation."""
+        try:
+            return cls(
+                start=datetime.fromisoformat(data["start"]),
+                started_by=data.get("started_by"),
+                side_switches=[
+                    (datetime.fromisoformat(at), side) for at, side in data.get("side_switches", [])
+                ],
+                stopped_at=datetime.fromisoformat(data["stopped_at"]) if data.get("stopped_at") else None
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def to_dict(self) -> dict:
+        """Serialize to dict."""
+        return {
+            "start": self.start.isoformat(),
+            "started_by": self.started_by,
+            "side_switches": [[at.isoformat(), side] for at, side in self.side_switches],
+            "stopped_at": self.stopped_at.isoformat() if self.stopped_at else None
+        }
+
+    def to_event(self, side: str | None) -> BabyEvent:
+        """Build the feeding event of the stopped session (side None if unknown)."""
+        end = self.stopped_at or datetime.now()
+        duration_s = int((end - self.start).total_seconds())
+        description = f"Durata: {duration_s // 60} min"
+        if side:
+            description = f"Lato: {side}, {description}"
+        extra = {}
+        if self.side_switches:
+            extra["side_switches"] = [[at.isoformat(), switch] for at, switch in self.side_switches]
+        if self.started_by:
+            extra["started_by"] = self.started_by
+        return BabyEvent(
+            type="feeding", start=self.start, end=end, summary="🍼 Poppata",
+            description=description, data=extra, side=side, duration_s=duration_s
+        )
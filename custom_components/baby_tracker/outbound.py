@@ -0,0 +1,120 @@
+"""Central outbound queue for the Baby Tracker bot.
+
+Every Bot API call of the application goes through OutboundQueue (a PTB rate
+limiter), so handlers keep calling reply_text/edit_message_text directly while
+the queue spaces requests per chat and globally, waits out 429 RetryAfter
+answers and skips edits of a message that a newer edit already supersedes.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import timedelta
+
+from telegram.error import RetryAfter
+from telegram.ext import BaseRateLimiter
+
+_LOGGER = logging.getLogger(__name__)
+
+# Telegram's documented limits: ~30 messages/s overall, 1/s per private chat,
+# 20/min per group
+GLOBAL_INTERVAL = 1 / 30
+PRIVATE_CHAT_INTERVAL = 1.0
+GROUP_CHAT_INTERVAL = 3.0
+MAX_RETRIES = 3
+
+# Edits where only the latest content matters
+MERGEABLE_ENDPOINTS = ("editMessageText", "editMessageReplyMarkup")
+
+
+class OutboundQueue(BaseRateLimiter[None]):
+    """Rate limiter with RetryAfter handling and merging of superseded edits."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._global_next = 0.0
+        self._chat_next: dict[int | str, float] = {}
+        self._paused_until = 0.0
+        # (chat, message, endpoint) -> latest queued edit, see process_request
+        self._edits: dict[tuple, list] = {}
+
+    async def initialize(self) -> None:
+        """Nothing to set up."""
+
+    async def shutdown(self) -> None:
+        """Forget the queue state."""
+        self._chat_next.clear()
+        self._edits.clear()
+
+    async def _acquire(self, chat_id, superseded=None) -> bool:
+        """Wait for a send slot; returns False if superseded while waiting."""
+        loop = asyncio.get_running_loop()
+        while True:
+            if superseded is not None and superseded():
+                return False
+            now = loop.time()
+            ready = max(self._paused_until, self._global_next, self._chat_next.get(chat_id, 0.0))
+            if ready <= now:
+                self._global_next = now + GLOBAL_INTERVAL
+                if chat_id is not None:
+                    # Group and channel ids are negative (or @usernames)
+                    private = isinstance(chat_id, int) and chat_id > 0
+                    self._chat_next[chat_id] = now + (PRIVATE_CHAT_INTERVAL if private else GROUP_CHAT_INTERVAL)
+                return True
+            await asyncio.sleep(ready - now)
+
+    async def _send(self, callback, args, kwargs, chat_id, superseded=None):
+        """Send with RetryAfter retries; returns (sent, result)."""
+        for attempt in range(MAX_RETRIES + 1):
+            if not await self._acquire(chat_id, superseded):
+                return False, None
+            try:
+                return True, await callback(*args, **kwargs)
+            except RetryAfter as err:
+                if attempt == MAX_RETRIES:
+                    raise
+                delay = err.retry_after
+                if isinstance(delay, timedelta):
+                    delay = delay.total_seconds()
+                _LOGGER.warning("Telegram flood control, retrying in %s s", delay)
+                # Flood control applies to the whole bot: hold every request
+                self._paused_until = asyncio.get_running_loop().time() + delay
+        raise AssertionError("unreachable")
+
+    async def process_request(self, callback, args, kwargs, endpoint, data, rate_limit_args):
+        """Queue one Bot API request."""
+        chat_id = data.get("chat_id")
+        if endpoint not in MERGEABLE_ENDPOINTS or data.get("message_id") is None:
+            return (await self._send(callback, args, kwargs, chat_id))[1]
+
+        key = (chat_id, data["message_id"], endpoint)
+        future = asyncio.get_running_loop().create_future()
+        # Consume the outcome so an unawaited failure is not logged
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        entry = [future, None]  # This edit's result, the future of the edit superseding it
+        if previous := self._edits.get(key):
+            previous[1] = future
+        self._edits[key] = entry
+        try:
+            sent, result = await self._send(callback, args, kwargs, chat_id, lambda: entry[1] is not None)
+            if not sent:
+                # A newer edit of the same message carries the final content
+                successor = entry[1]
+                await asyncio.wait((successor,))
+                if successor.cancelled() or successor.exception() is not None:
+                    # ...unless it did not go through: send this one after all
+                    sent, result = await self._send(callback, args, kwargs, chat_id)
+                else:
+                    result = successor.result()
+        except Exception as err:
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            # Cancelled callers must not leave an older edit waiting forever
+            if not future.done():
+                future.cancel()
+            if self._edits.get(key) is entry:
+                del self._edits[key]
@@ -1,14 +1,41 @@
 """Sensor platform for Baby Tracker."""
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from datetime import datetime, timedelta
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import UnitOfLength, UnitOfMass, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import BabyTrackerCoordinator
+from .stats import AVERAGE_WINDOWS
+
+# Average statistics: key in the averages snapshot -> (icon, name, unit)
+AVERAGE_SENSORS = {
+    "feeding": ("mdi:baby-bottle-outline", "Poppate al giorno", None),
+    "feeding_minutes": ("mdi:timer-outline", "Durata media poppata", "min"),
+    "poo": ("mdi:emoticon-poop-outline", "Cacche al giorno", None),
+    "pee": ("mdi:water-outline", "Pipì al giorno", None),
+}
+
+# Growth sensors: metric -> (icon, name, device class, unit)
+GROWTH_SENSORS = {
+    "weight": ("mdi:scale-bathroom", "Peso", SensorDeviceClass.WEIGHT, UnitOfMass.KILOGRAMS),
+    "height": ("mdi:human-male-height", "Altezza", SensorDeviceClass.DISTANCE, UnitOfLength.CENTIMETERS),
+    "head": ("mdi:tape-measure", "Circonferenza Testa", SensorDeviceClass.DISTANCE, UnitOfLength.CENTIMETERS),
+}
+
+# Side to offer at the next breastfeeding, given the last one
+NEXT_SIDE = {"sx": "dx", "dx": "sx"}
+SIDE_NAMES = {"sx": "Sinistra", "dx": "Destra"}
+
+def _round(value: float | None, digits: int) -> float | None:
+    return round(value, digits) if value is not None else None
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -22,6 +49,15 @@ async def async_setup_entry(
         BabyTrackerCounter(coordinator, entry, "feeding", "mdi:baby-bottle", "Poppate Oggi"),
         BabyTrackerCounter(coordinator, entry, "poo", "mdi:emoticon-poop", "Cacche Oggi"),
         BabyTrackerCounter(coordinator, entry, "pee", "mdi:water", "Pipì Oggi"),
+        BabyTrackerNextSide(coordinator, entry),
+        BabyTrackerFeedingElapsed(coordinator, entry),
+    ] + [
+        BabyTrackerGrowth(coordinator, entry, metric, *GROWTH_SENSORS[metric])
+        for metric in GROWTH_SENSORS
+    ] + [
+        BabyTrackerAverage(coordinator, entry, key, days, *AVERAGE_SENSORS[key])
+        for days in AVERAGE_WINDOWS
+        for key in AVERAGE_SENSORS
     ])
 
 class BabyTrackerCounter(CoordinatorEntity, SensorEntity):
@@ -49,5 +85,166 @@ class BabyTrackerCounter(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        stats = self.coordinator.get_todays_counts()
-        return stats.get(self._count_type, 0)
+        return self.coordinator.data.counts.get(self._count_type, 0)
+
+
+class BabyTrackerAverage(CoordinatorEntity, SensorEntity):
+    """Per-day average of a statistic over the last days, from the daily rollup."""
+
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: BabyTrackerCoordinator,
+        entry: ConfigEntry,
+        key: str,
+        days: int,
+        icon: str,
+        name: str,
+        unit: str | None
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._key = key
+        self._days = days
+        self._attr_icon = icon
+        self._attr_name = f"{name} ({days} giorni)"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_unique_id = f"{entry.entry_id}_{key}_avg_{days}d"
+
+    @property
+    def native_value(self) -> float:
+        """Return the state of the sensor."""
+        return self.coordinator.data.averages[self._days][self._key]
+
+
+class BabyTrackerGrowth(CoordinatorEntity, SensorEntity):
+    """Latest measurement of a growth metric, from the store's growth series."""
+
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    # The full series is for cards and templates, not for the recorder
+    _unrecorded_attributes = frozenset({"series"})
+
+    def __init__(
+        self,
+        coordinator: BabyTrackerCoordinator,
+        entry: ConfigEntry,
+        metric: str,
+        icon: str,
+        name: str,
+        device_class: SensorDeviceClass,
+        unit: str
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._metric = metric
+        self._attr_icon = icon
+        self._attr_name = name
+        self._attr_device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+        self._attr_unique_id = f"{entry.entry_id}_{metric}"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        return self.coordinator.data.growth[self._metric]["value"]
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return when it was measured, velocity, WHO percentile and the series."""
+        growth = self.coordinator.data.growth[self._metric]
+        return {
+            "measured_at": growth["measured_at"],
+            "velocity_per_week": _round(growth["velocity_per_week"], 3),
+            "z_score": _round(growth["z_score"], 2),
+            "percentile": _round(growth["percentile"], 1),
+            "series": [
+                (at.isoformat(), value, _round(pct, 1))
+                for (at, value), (_z, pct) in zip(growth["series"], growth["percentiles"])
+            ],
+        }
+
+
+class BabyTrackerNextSide(CoordinatorEntity, SensorEntity):
+    """Side to offer at the next breastfeeding, alternating from the last one."""
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:swap-horizontal"
+    _attr_name = "Prossimo Lato"
+
+    def __init__(self, coordinator: BabyTrackerCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}_next_side"
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the state of the sensor."""
+        next_side = NEXT_SIDE.get(self.coordinator.data.last_side)
+        return SIDE_NAMES.get(next_side)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the raw sides."""
+        last_side = self.coordinator.data.last_side
+        return {"last_side": last_side, "next_side": NEXT_SIDE.get(last_side)}
+
+
+class BabyTrackerFeedingElapsed(CoordinatorEntity, SensorEntity):
+    """Elapsed time of the live feeding, ticking every second while it runs.
+
+    The tick only writes this entity's state: no coordinator refresh, no store access.
+    """
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:timer-sand"
+    _attr_name = "Durata Poppata in Corso"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+
+    def __init__(self, coordinator: BabyTrackerCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}_feeding_elapsed"
+        self._unsub_tick = None
+
+    async def async_added_to_hass(self) -> None:
+        """Start ticking if a (restored) feeding is already running."""
+        await super().async_added_to_hass()
+        self._sync_tick()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop ticking."""
+        await super().async_will_remove_from_hass()
+        self._stop_tick()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Start or stop ticking when the feeding starts or stops."""
+        self._sync_tick()
+        super()._handle_coordinator_update()
+
+    def _sync_tick(self):
+        if self.coordinator.data.is_feeding and self._unsub_tick is None:
+            self._unsub_tick = async_track_time_interval(
+                self.hass, self._async_tick, timedelta(seconds=1)
+            )
+        elif not self.coordinator.data.is_feeding:
+            self._stop_tick()
+
+    def _stop_tick(self):
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> int:
+        """Return the state of the sensor."""
+        start = self.coordinator.data.feeding_start_time
+        return int((datetime.now() - start).total_seconds()) if start else 0
@@ -0,0 +1,97 @@
+"""Incremental statistics for Baby Tracker."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from datetime import datetime, timedelta
+from operator import attrgetter, itemgetter
+
+from .models import BabyEvent, DailySummary
+
+CATEGORIES = ("feeding", "poo", "pee", "growth", "sleep")
+
+# Windows (in days) of the average statistics sensors
+AVERAGE_WINDOWS = (7, 30)
+
+WEEK_SECONDS = 7 * 24 * 3600
+
+
+class RollingWindowStats:
+    """Per-category counts of the events started within a sliding time window.
+
+    Events enter in O(1) (a back-dated one is bisected into place) and leave lazily
+    from the left of the deque when the counts are read.
+    """
+
+    def __init__(self, window: timedelta) -> None:
+        """Initialize an empty window."""
+        self.window = window
+        self._entries: deque[tuple[datetime, tuple[str, ...]]] = deque()
+        self._counts = dict.fromkeys(CATEGORIES, 0)
+
+    def reset(self, events: list[BabyEvent], now: datetime | None = None):
+        """Refill the window from start-sorted events."""
+        self._entries.clear()
+        self._counts = dict.fromkeys(CATEGORIES, 0)
+        cutoff = (now or datetime.now()) - self.window
+        for event in events[bisect_left(events, cutoff, key=attrgetter("start")):]:
+            self.add(event, now)
+
+    def add(self, event: BabyEvent, now: datetime | None = None):
+        """Account for a new event if it falls inside the window."""
+        if event.start < (now or datetime.now()) - self.window:
+            return
+        entry = (event.start, event.categories)
+        if not self._entries or event.start >= self._entries[-1][0]:
+            self._entries.append(entry)
+        else:
+            self._entries.insert(bisect_right(self._entries, event.start, key=itemgetter(0)), entry)
+        for category in entry[1]:
+            self._counts[category] += 1
+
+    def expire(self, now: datetime | None = None):
+        """Drop the events that have slid out of the window."""
+        cutoff = (now or datetime.now()) - self.window
+        while self._entries and self._entries[0][0] < cutoff:
+            _, categories = self._entries.popleft()
+            for category in categories:
+                self._counts[category] -= 1
+
+    def next_expiry(self, now: datetime | None = None) -> datetime | None:
+        """Return when the oldest event in the window slides out, if any."""
+        self.expire(now)
+        return self._entries[0][0] + self.window if self._entries else None
+
+    def counts(self, now: datetime | None = None) -> dict[str, int]:
+        """Return the current counts per category."""
+        self.expire(now)
+        return dict(self._counts)
+
+
+def growth_velocity(
+    series: list[tuple[datetime, float]], min_span: timedelta = timedelta(days=7)
+) -> float | None:
+    """Change per week between the latest measurement and the last one at least min_span older."""
+    if not series:
+        return None
+    latest_at, latest = series[-1]
+    idx = bisect_right(series, latest_at - min_span, key=itemgetter(0))
+    if not idx:
+        return None
+    earlier_at, earlier = series[idx - 1]
+    return (latest - earlier) / ((latest_at - earlier_at).total_seconds() / WEEK_SECONDS)
+
+
+def daily_averages(summaries: list[DailySummary]) -> dict[str, float]:
+    """Average the per-day rollups of a window over the days that have data."""
+    days = len(summaries)
+    if not days:
+        return {"feeding": 0.0, "poo": 0.0, "pee": 0.0, "feeding_minutes": 0.0}
+    feedings = sum(summary.counts.get("feeding", 0) for summary in summaries)
+    minutes = sum(summary.feeding_minutes for summary in summaries)
+    return {
+        "feeding": round(feedings / days, 1),
+        "poo": round(sum(summary.counts.get("poo", 0) for summary in summaries) / days, 1),
+        "pee": round(sum(summary.counts.get("pee", 0) for summary in summaries) / days, 1),
+        "feeding_minutes": round(minutes / feedings, 1) if feedings else 0.0,
+    }
@@ -0,0 +1,82 @@
+"""Telegram webhook endpoint for Baby Tracker.
+
+Instead of a long-poll loop per entry, Telegram can POST updates to Home
+Assistant's own HTTP server; they are fed straight into the entry's bot
+application.
+"""
+from __future__ import annotations
+
+import hmac
+import logging
+import secrets
+from http import HTTPStatus
+
+from aiohttp import web
+from telegram import Update
+from telegram.error import TelegramError
+from telegram.ext import Application
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Keyed by bot id: one endpoint per bot, whatever the number of babies it serves
+WEBHOOK_PATH = "/api/baby_tracker/telegram/{bot_id}"
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+async def async_start_webhook(application: Application, base_url: str, bot_id: str):
+    """Register the bot's endpoint with Telegram, protected by a fresh secret."""
+    secret = secrets.token_urlsafe(32)
+    application.bot_data['webhook_secret'] = secret
+    url = base_url.rstrip("/") + WEBHOOK_PATH.format(bot_id=bot_id)
+    await application.bot.set_webhook(url=url, secret_token=secret, allowed_updates=Update.ALL_TYPES)
+    _LOGGER.info("Telegram webhook registered at %s", url)
+
+
+async def async_stop_webhook(application: Application):
+    """Unregister the bot's endpoint, so Telegram stops posting to it."""
+    application.bot_data.pop('webhook_secret', None)
+    try:
+        await application.bot.delete_webhook()
+    except TelegramError as err:
+        _LOGGER.warning("Could not remove the Telegram webhook: %s", err)
+
+
+async def async_process_webhook(application: Application | None, secret: str | None, payload) -> HTTPStatus:
+    """Validate an incoming update and process it with the bot application."""
+    if application is None or 'webhook_secret' not in application.bot_data:
+        return HTTPStatus.NOT_FOUND
+    if not hmac.compare_digest(secret or "", application.bot_data['webhook_secret']):
+        _LOGGER.warning("Rejected Telegram webhook call with a wrong secret")
+        return HTTPStatus.UNAUTHORIZED
+
+    update = Update.de_json(payload, application.bot) if isinstance(payload, dict) else None
+    if update is None:
+        return HTTPStatus.BAD_REQUEST
+
+    await application.process_update(update)
+    return HTTPStatus.OK
+
+
+class BabyTrackerWebhookView(HomeAssistantView):
+    """Receive Telegram updates for every Baby Tracker bot."""
+
+    url = WEBHOOK_PATH
+    name = "api:baby_tracker:telegram"
+    requires_auth = False
+
+    async def post(self, request: web.Request, bot_id: str) -> web.Response:
+        """Handle an update POSTed by Telegram."""
+        hass = request.app[KEY_HASS]
+        try:
+            payload = await request.json()
+        except ValueError:
+            return self.json_message("Invalid JSON", HTTPStatus.BAD_REQUEST)
+
+        registry = hass.data.get(DOMAIN, {}).get("bots")
+        application = registry.applications.get(bot_id) if registry else None
+        status = await async_process_webhook(application, request.headers.get(SECRET_HEADER), payload)
+        return self.json_message(status.phrase, status)
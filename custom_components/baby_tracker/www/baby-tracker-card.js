@@ -147,10 +147,10 @@ class BabyTrackerCard extends HTMLElement {
         const btn = this.querySelector('button');
         if (btn) {
             btn.onclick = () => {
-                // We need a proper service now that input_boolean is gone.
-                // For layout purposes, let's assume we add a service.
+                // entry_id (card config) picks the baby; only needed with more than one
                 const service = feedingState === 'on' ? 'stop_feeding' : 'start_feeding';
-                this._hass.callService('baby_tracker', service, {});
+                const data = this.config.entry_id ? {entry_id: this.config.entry_id} : {};
+                this._hass.callService('baby_tracker', service, data);
             };
         }
     }
@@ -0,0 +1,210 @@
+"""Replay recorded Telegram updates against the Baby Tracker webhook endpoint.
+
+Offline (default): builds the real bot application with a recording Telegram
+request layer and a recording coordinator, registers it in the bot registry,
+serves the integration's webhook view on a local aiohttp test server and POSTs
+every payload to it. No network access and no
+running Home Assistant are needed (only the homeassistant and
+python-telegram-bot packages):
+
+    python tools/webhook_harness.py
+
+There is no mode against a running Home Assistant: its endpoint only accepts
+the secret generated (in memory) when the webhook is registered with Telegram.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+from homeassistant.components.http import KEY_HASS
+from telegram.request import BaseRequest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+# Load the bot modules without the integration's __init__ (setup entry points)
+_package = ModuleType("custom_components.baby_tracker")
+_package.__path__ = [str(ROOT / "custom_components" / "baby_tracker")]
+sys.modules["custom_components.baby_tracker"] = _package
+
+from custom_components.baby_tracker.bot import (  # noqa: E402
+    BotRegistry,
+    add_baby,
+    bot_id_from_token,
+    build_application,
+)
+from custom_components.baby_tracker.const import DOMAIN  # noqa: E402
+from custom_components.baby_tracker.models import FeedingSession  # noqa: E402
+from custom_components.baby_tracker.webhook import (  # noqa: E402
+    SECRET_HEADER,
+    WEBHOOK_PATH,
+    BabyTrackerWebhookView,
+    async_start_webhook,
+    async_stop_webhook,
+)
+
+PAYLOADS = Path(__file__).parent / "webhook_payloads"
+TOKEN = "4242:harness-token"
+ENTRY_ID = "harness"
+ALLOWED_IDS = [123456, 654321]
+BOT_USER = {"id": 4242, "is_bot": True, "first_name": "Baby Tracker", "username": "baby_tracker_bot"}
+
+
+class RecordingRequest(BaseRequest):
+    """Telegram request layer that records API calls instead of sending them."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, dict]] = []
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    @property
+    def read_timeout(self):
+        return None
+
+    async def do_request(self, url, method, request_data=None, **timeouts):
+        endpoint = url.rsplit("/", 1)[-1]
+        params = request_data.parameters if request_data else {}
+        self.calls.append((endpoint, params))
+        if endpoint == "getMe":
+            result = BOT_USER
+        elif endpoint == "sendMessage":
+            result = {
+                "message_id": len(self.calls),
+                "date": int(datetime.now().timestamp()),
+                "chat": {"id": params.get("chat_id"), "type": "private"},
+                "from": BOT_USER,
+                "text": params.get("text", ""),
+            }
+        else:
+            result = True
+        return 200, json.dumps({"ok": True, "result": result}).encode()
+
+
+class RecordingCoordinator:
+    """Coordinator stand-in that keeps logged events in a list."""
+
+    def __init__(self):
+        self.events = []
+        self.session = None
+
+    @property
+    def is_feeding(self):
+        return self.session is not None and self.session.stopped_at is None
+
+    async def async_add_event(self, event):
+        self.events.append(event)
+
+    async def async_add_events(self, events):
+        self.events.extend(events)
+
+    def start_feeding(self, started_by=None):
+        self.session = FeedingSession(datetime.now(), started_by)
+
+    def switch_side(self, side):
+        if self.is_feeding:
+            self.session.side_switches.append((datetime.now(), side))
+
+    def stop_feeding(self):
+        if not self.is_feeding:
+            return None
+        self.session.stopped_at = datetime.now()
+        return self.session
+
+    async def async_log_stopped_feeding(self, side):
+        if not (self.session and self.session.stopped_at):
+            return None
+        event, self.session = self.session.to_event(side), None
+        self.events.append(event)
+        return event
+
+
+def load_payloads() -> list[tuple[str, dict]]:
+    return [(path.name, json.loads(path.read_text(encoding="utf-8"))) for path in sorted(PAYLOADS.glob("*.json"))]
+
+
+async def post(client: TestClient, path: str, payload, secret: str | None) -> int:
+    """POST a payload to the webhook route and return the HTTP status."""
+    headers = {SECRET_HEADER: secret} if secret is not None else {}
+    async with client.post(path, json=payload, headers=headers) as resp:
+        return resp.status
+
+
+async def run_offline() -> int:
+    """Serve the endpoint locally and check every payload is accepted."""
+    recorder = RecordingRequest()
+    coordinator = RecordingCoordinator()
+    # A live feeding restored from storage: the fresh application has no
+    # conversation state, as after a restart
+    coordinator.start_feeding("Mamma")
+    hass = SimpleNamespace(data={DOMAIN: {ENTRY_ID: coordinator}}, is_stopping=False)
+    application = build_application(hass, TOKEN, request=recorder)
+    add_baby(application, ENTRY_ID, "Baby", ALLOWED_IDS)
+    bot_id = bot_id_from_token(TOKEN)
+    await application.initialize()
+    # The view finds the application through the registry, by bot id
+    registry = hass.data[DOMAIN]["bots"] = BotRegistry(hass)
+    registry.applications[bot_id] = application
+
+    app = web.Application()
+    app[KEY_HASS] = hass
+    BabyTrackerWebhookView().register(hass, app, app.router)
+    path = WEBHOOK_PATH.format(bot_id=bot_id)
+    failures = 0
+    async with TestClient(TestServer(app)) as client:
+        await async_start_webhook(application, str(client.make_url("")), bot_id)
+        secret = application.bot_data['webhook_secret']
+        for name, payload in load_payloads():
+            recorder.calls.clear()
+            status = await post(client, path, payload, secret)
+            print(f"{name}: HTTP {status}")
+            failures += status != 200
+            for endpoint, params in recorder.calls:
+                print(f"    -> {endpoint} {params.get('text', '')!r}".rstrip())
+
+        checks = [
+            ("wrong secret", path, secret[::-1], 401),
+            ("missing secret", path, None, 401),
+            ("unknown bot", WEBHOOK_PATH.format(bot_id="0"), secret, 404),
+        ]
+        for label, check_path, check_secret, expected in checks:
+            status = await post(client, check_path, {}, check_secret)
+            print(f"{label}: HTTP {status}")
+            failures += status != expected
+
+        recorder.calls.clear()
+        await async_stop_webhook(application)
+        endpoints = [endpoint for endpoint, _params in recorder.calls]
+        print(f"webhook removed: {endpoints}")
+        failures += "deleteWebhook" not in endpoints
+        # Without a registered webhook the route no longer accepts updates
+        status = await post(client, path, {}, secret)
+        print(f"after removal: HTTP {status}")
+        failures += status != 404
+
+    await application.shutdown()
+    print("Logged events:")
+    for event in coordinator.events:
+        print(f"    {event.type} {event.summary} {event.description}".rstrip())
+    return failures
+
+
+def main():
+    argparse.ArgumentParser(description=__doc__.splitlines()[0]).parse_args()
+    failures = asyncio.run(run_offline())
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()